@@ -39,21 +39,21 @@ Date: 2025-01-28
 """
 
 import argparse
+import functools
+import importlib.util
+import math
 import sys
 import time
 import struct
 from pathlib import Path
-from typing import Optional, List, Dict
+from typing import TYPE_CHECKING, Optional, Dict, Sequence
 
-# Check for Moku API
-try:
-    from moku.instruments import MultiInstrument, CloudCompile, Oscilloscope
-    MOKU_AVAILABLE = True
-except ImportError:
-    print("ERROR: Moku API not available")
-    print("Install with: pip install moku")
-    MOKU_AVAILABLE = False
-    sys.exit(1)
+# Check for Moku API without importing it - the SDK is only loaded once we
+# actually talk to hardware, so --help and module imports stay fast
+MOKU_AVAILABLE = importlib.util.find_spec("moku") is not None
+
+if TYPE_CHECKING:
+    from moku.instruments import CloudCompile
 
 
 # ============================================================================
@@ -90,6 +90,20 @@ class ObserverVoltages:
     TOLERANCE = 0.05
 
 
+# Observer states keyed by their nominal voltage rounded to the nearest volt.
+# Every reference level sits on a whole volt and the levels are >= 1V apart
+# (well over 2 * TOLERANCE), so round() finds the only candidate in one lookup.
+_OBSERVER_LEVELS = {
+    round(ref): (ref, name, state_id, is_fault)
+    for ref, name, state_id, is_fault in (
+        (ObserverVoltages.IDLE, 'IDLE', BRAMLoaderStates.IDLE, False),
+        (ObserverVoltages.LOADING, 'LOADING', BRAMLoaderStates.LOADING, False),
+        (ObserverVoltages.DONE, 'DONE', BRAMLoaderStates.DONE, False),
+        (ObserverVoltages.FAULT, 'FAULT', BRAMLoaderStates.RESERVED, True),
+    )
+}
+
+
 def decode_observer_voltage(voltage: float) -> Dict:
     """
     Decode FSM observer voltage to state information.
@@ -104,48 +118,35 @@ def decode_observer_voltage(voltage: float) -> Dict:
             - voltage: Raw voltage reading
             - is_fault: Boolean indicating fault condition
     """
-    # Determine state based on voltage with tolerance
-    if abs(voltage - ObserverVoltages.IDLE) < ObserverVoltages.TOLERANCE:
-        return {
-            'state_name': 'IDLE',
-            'state_id': BRAMLoaderStates.IDLE,
-            'voltage': voltage,
-            'is_fault': False
-        }
-    elif abs(voltage - ObserverVoltages.LOADING) < ObserverVoltages.TOLERANCE:
-        return {
-            'state_name': 'LOADING',
-            'state_id': BRAMLoaderStates.LOADING,
-            'voltage': voltage,
-            'is_fault': False
-        }
-    elif abs(voltage - ObserverVoltages.DONE) < ObserverVoltages.TOLERANCE:
+    # Nearest reference level, then check it is within tolerance
+    level = _OBSERVER_LEVELS.get(round(voltage)) if math.isfinite(voltage) else None
+    if level is not None and abs(voltage - level[0]) < ObserverVoltages.TOLERANCE:
+        _, state_name, state_id, is_fault = level
         return {
-            'state_name': 'DONE',
-            'state_id': BRAMLoaderStates.DONE,
+            'state_name': state_name,
+            'state_id': state_id,
             'voltage': voltage,
-            'is_fault': False
-        }
-    elif voltage < 0 and abs(voltage - ObserverVoltages.FAULT) < ObserverVoltages.TOLERANCE:
-        return {
-            'state_name': 'FAULT',
-            'state_id': BRAMLoaderStates.RESERVED,
-            'voltage': voltage,
-            'is_fault': True
-        }
-    else:
-        return {
-            'state_name': f'UNKNOWN({voltage:.3f}V)',
-            'state_id': None,
-            'voltage': voltage,
-            'is_fault': False
+            'is_fault': is_fault
         }
 
+    return {
+        'state_name': f'UNKNOWN({voltage:.3f}V)',
+        'state_id': None,
+        'voltage': voltage,
+        'is_fault': False
+    }
+
 
 # ============================================================================
 # BRAM Loading Protocol
 # ============================================================================
 
+@functools.lru_cache(maxsize=32)
+def _word_struct(word_count: int) -> struct.Struct:
+    """Compiled little-endian layout for word_count 32-bit words (cached per length)"""
+    return struct.Struct(f'<{word_count}I')
+
+
 class BRAMLoader:
     """
     BRAM loading implementation using Control Register protocol.
@@ -159,7 +160,7 @@ class BRAMLoader:
         Control14        : Reserved
     """
 
-    def __init__(self, cloud_compile: CloudCompile):
+    def __init__(self, cloud_compile: 'CloudCompile'):
         """
         Initialize BRAM loader.
 
@@ -168,12 +169,31 @@ class BRAMLoader:
         """
         self.cc = cloud_compile
 
-    def load_buffer(self, data: List[int], progress_callback=None) -> bool:
+    def _write_controls(self, controls: Dict[int, int]):
+        """
+        Write several control registers in one RPC where the SDK allows it.
+
+        Uses CloudCompile.set_controls() (one request for all registers) when
+        available, otherwise falls back to one set_control_matrix() per register.
+        Registers are written in ascending order either way.
+
+        Args:
+            controls: Dict of {register_number: value}
+        """
+        if hasattr(self.cc, 'set_controls'):
+            self.cc.set_controls([
+                {'idx': reg, 'value': value} for reg, value in sorted(controls.items())
+            ])
+        else:
+            for reg, value in sorted(controls.items()):
+                self.cc.set_control_matrix(0, reg, value)
+
+    def load_buffer(self, data: Sequence[int], progress_callback=None) -> bool:
         """
         Load data buffer to BRAM.
 
         Args:
-            data: List of 32-bit integers to write
+            data: Sequence of 32-bit integers to write (list, tuple or memoryview)
             progress_callback: Optional callback(word_index, total) for progress updates
 
         Returns:
@@ -194,21 +214,16 @@ class BRAMLoader:
             self.cc.set_control_matrix(0, 10, control10)
             time.sleep(0.01)  # Allow FSM to transition to LOADING
 
-            # Step 2: Write each word
+            # Step 2: Write each word (two batched writes per word)
+            # No sleeps: volo_bram_loader latches on the rising edge of
+            # Control13[0] (one clock), and each control write is already a
+            # network round-trip of ~1ms between strobe high and low.
             for addr, word in enumerate(data):
-                # Set address
-                self.cc.set_control_matrix(0, 11, addr)
-
-                # Set data
-                self.cc.set_control_matrix(0, 12, word)
-
-                # Pulse write strobe (high)
-                self.cc.set_control_matrix(0, 13, 0x0001)
-                time.sleep(0.001)  # Hold strobe
+                # Set address + data and raise write strobe together
+                self._write_controls({11: addr, 12: word, 13: 0x0001})
 
                 # Deassert strobe (low)
-                self.cc.set_control_matrix(0, 13, 0x0000)
-                time.sleep(0.001)  # Post-write delay
+                self._write_controls({13: 0x0000})
 
                 # Progress callback
                 if progress_callback:
@@ -249,9 +264,13 @@ class BRAMLoader:
             print(f"WARNING: Buffer truncated to 4KB (was {len(raw_bytes)} bytes)")
             raw_bytes = raw_bytes[:4096]
 
-        # Unpack to 32-bit words (little-endian)
-        word_count = len(raw_bytes) // 4
-        data = list(struct.unpack(f'<{word_count}I', raw_bytes))
+        # Unpack to 32-bit words (little-endian). On little-endian hosts the
+        # file bytes already are the words, so view them in place instead of
+        # boxing every word into a new list.
+        if sys.byteorder == 'little' and struct.calcsize('I') == 4:
+            data = memoryview(raw_bytes).cast('I')
+        else:
+            data = _word_struct(len(raw_bytes) // 4).unpack(raw_bytes)
 
         print(f"Loaded {len(data)} words ({len(raw_bytes)} bytes) from {buffer_path.name}")
         return self.load_buffer(data, progress_callback)
@@ -286,6 +305,8 @@ class BRAMLoaderDeployment:
         """Connect to Moku device"""
         print(f"Connecting to Moku at {self.moku_ip}...")
         try:
+            from moku.instruments import MultiInstrument
+
             self.multi_instrument = MultiInstrument(
                 self.moku_ip,
                 platform_id=2,  # Moku:Go (change to 1 for Moku:Lab, 4 for Moku:Pro)
@@ -306,6 +327,8 @@ class BRAMLoaderDeployment:
             return False
 
         try:
+            from moku.instruments import CloudCompile
+
             self.cloud_compile = self.multi_instrument.set_instrument(1, CloudCompile)
             self.cloud_compile.load_bitstream(str(self.bitstream_path))
             print("✓ Bitstream deployed to Slot 1")
@@ -322,6 +345,8 @@ class BRAMLoaderDeployment:
         """Setup Oscilloscope in Slot 2 to monitor FSM observer output"""
         print("Setting up oscilloscope for FSM observer monitoring...")
         try:
+            from moku.instruments import Oscilloscope
+
             self.oscilloscope = self.multi_instrument.set_instrument(2, Oscilloscope)
 
             # Configure oscilloscope
@@ -420,9 +445,14 @@ class BRAMLoaderDeployment:
             print("-" * 70)
 
             def progress_callback(current, total):
-                if current % 50 == 0 or current == total:
+                # Every 64 words (bit mask, no modulo) plus the final word
+                if (current & 63) == 0 or current == total:
                     print(f"  Progress: {current}/{total} words ({100*current//total}%)")
 
+            # Progress lines are only useful interactively; skip them when piped to a log
+            if not sys.stdout.isatty():
+                progress_callback = None
+
             success = self.bram_loader.load_from_file(self.buffer_path, progress_callback)
 
             # Monitor state during/after loading
@@ -500,6 +530,11 @@ Examples:
 
     args = parser.parse_args()
 
+    if not MOKU_AVAILABLE:
+        print("ERROR: Moku API not available")
+        print("Install with: pip install moku")
+        return False
+
     # Interactive prompts if arguments not provided
     if not args.ip:
         args.ip = input("Moku IP address [192.168.13.159]: ") or "192.168.13.159"
@@ -11,28 +11,100 @@ Author: AI-generated validation test
 Date: 2025-10-24
 """
 
+import functools
+import logging
+import math
+import os
+from typing import Iterable, List, Tuple, Union
+
+try:
+    from math import fma  # Python 3.13+: x * y + z with a single rounding
+except ImportError:
+    def fma(x: float, y: float, z: float) -> float:
+        return x * y + z
+
 import cocotb
-from cocotb.triggers import RisingEdge, ClockCycles
-from conftest import (
-    setup_clock,
-    reset_active_low,
-    run_with_timeout
-)
+from cocotb.triggers import RisingEdge, ClockCycles, Timer
+from conftest import DEFAULT_CLK_PERIOD_NS, setup_clock
+
+# The testbench's narrative logging (banners, per-step voltages) is all INFO.
+# Like the progressive tests, it only shows at COCOTB_VERBOSITY=NORMAL or above;
+# the default MINIMAL keeps warnings/errors, and assertion failures are always
+# reported by cocotb. EZEMFI_PERF=1 silences the logger entirely for timing runs.
+_VERBOSE = os.environ.get("COCOTB_VERBOSITY", "MINIMAL").upper() not in ("SILENT", "MINIMAL")
+_PERF_MODE = os.environ.get("EZEMFI_PERF") == "1"
+# cocotb.top only exists inside a simulation, so tools can still import this
+if getattr(cocotb, "top", None) is not None:
+    if _PERF_MODE:
+        cocotb.top._log.disabled = True  # info() then returns before building a record
+    elif not _VERBOSE:
+        cocotb.top._log.setLevel(logging.WARNING)
+
+_BANNER = "=" * 80
 
 
 # ============================================================================
 # Helper Functions
 # ============================================================================
 
-def voltage_to_digital(voltage: float) -> int:
-    """Convert voltage to Moku 16-bit signed digital (±5V scale)"""
-    digital = int((voltage / 5.0) * 32768)
-    return max(-32768, min(32767, digital))
+# Moku ±5V full scale: digital counts per volt, and volts per count
+_SCALE = 32768.0 / 5.0
+_INV_SCALE = 5.0 / 32768.0
+
+
+def voltage_to_digital(voltage: Union[float, Iterable[float]],
+                       _int=int, _scale=_SCALE) -> Union[int, List[int]]:
+    """Convert voltage to Moku 16-bit signed digital (±5V scale)
+
+    Also accepts an iterable of voltages and returns a list (see voltages_to_digital).
+    (_int/_scale are bound as defaults so the hot path uses locals, not globals.)
+    """
+    try:
+        d = _int(voltage * _scale)
+    except TypeError:
+        return voltages_to_digital(voltage)
+    return -32768 if d < -32768 else (32767 if d > 32767 else d)
+
+
+def voltages_to_digital(voltages: Iterable[float]) -> List[int]:
+    """Convert many voltages to Moku digital in one pass (same result as voltage_to_digital)"""
+    scale = _SCALE
+    # Saturate with one chained comparison instead of nested min()/max() calls
+    return [
+        d if -32768 <= (d := int(v * scale)) <= 32767 else (32767 if d > 0 else -32768)
+        for v in voltages
+    ]
+
+
+def digital_to_voltage(digital: Union[int, Iterable[int]]) -> Union[float, List[float]]:
+    """Convert Moku digital to voltage
+
+    Also accepts an iterable of digital values and returns a list (see digitals_to_voltages).
+    """
+    try:
+        return digital * _INV_SCALE
+    except TypeError:
+        return digitals_to_voltages(digital)
+
+
+def digitals_to_voltages(digitals: Iterable[int]) -> List[float]:
+    """Convert many Moku digital values to voltage in one pass (same result as digital_to_voltage)"""
+    inv_scale = _INV_SCALE
+    return [d * inv_scale for d in digitals]
+
+
+def _voltage_step(num_normal_states: int, v_min: float, v_max: float) -> float:
+    """Voltage spacing between adjacent normal states (automatic spreading)"""
+    if num_normal_states > 1:
+        return (v_max - v_min) / (num_normal_states - 1)
+    return 0.0
 
 
-def digital_to_voltage(digital: int) -> float:
-    """Convert Moku digital to voltage"""
-    return (digital / 32768.0) * 5.0
+@functools.lru_cache(maxsize=32)
+def _expected_table(num_normal_states: int, v_min: float, v_max: float) -> Tuple[float, ...]:
+    """Expected voltage of every normal state, computed once per observer configuration"""
+    v_step = _voltage_step(num_normal_states, v_min, v_max)
+    return tuple(fma(i, v_step, v_min) for i in range(num_normal_states))
 
 
 def calculate_expected_voltage(state_index: int, num_normal_states: int = 6,
@@ -47,844 +119,781 @@ def calculate_expected_voltage(state_index: int, num_normal_states: int = 6,
 
     Note: Must match VHDL fsm_observer.vhd logic which uses num_normal, not num_states!
     """
-    if num_normal_states > 1:
-        v_step = (v_max - v_min) / (num_normal_states - 1)
-    else:
-        v_step = 0.0
-    return v_min + (state_index * v_step)
+    if 0 <= state_index < num_normal_states:
+        return _expected_table(num_normal_states, v_min, v_max)[state_index]
+    # Outside the normal range: same formula, not worth caching
+    return fma(state_index, _voltage_step(num_normal_states, v_min, v_max), v_min)
+
+
+def expected_voltage_table(num_normal_states: int = 6, v_min: float = 0.0,
+                           v_max: float = 2.5) -> Tuple[float, ...]:
+    """Expected voltages of all normal states, indexed by state (see calculate_expected_voltage)"""
+    return _expected_table(num_normal_states, v_min, v_max)
+
+
+# Output range of the example FSM's observer: IDLE (state 0) sits at V_MIN and
+# RUNNING (state 5, the last normal state) at V_MAX
+V_MIN, V_MAX = 0.0, 2.5
+assert (calculate_expected_voltage(0) == V_MIN
+        and calculate_expected_voltage(5) == V_MAX), "voltage-spread constants drifted from module"
+
+# Expected observer output of the 6 normal states, indexed by state, and the
+# spacing between consecutive states
+_EXPECTED_V = expected_voltage_table(6, V_MIN, V_MAX)
+_EXPECTED_STEP = _voltage_step(6, V_MIN, V_MAX)
+
+# Sign-flip fault cases: (source state, state index, cycles after start to reach it,
+# fault input). Both fault inputs are covered, from 0V, mid-range and V_MAX.
+_SIGN_FLIP_CASES = (
+    ("IDLE", 0, 0, "inject_error"),
+    ("LOADING", 2, 5, "inject_fault"),
+    ("VALIDATING", 3, 12, "inject_error"),
+    ("RUNNING", 5, 20, "inject_fault"),
+)
 
 
-# ============================================================================
-# Tests
-# ============================================================================
+# Width of the observer's voltage_out port (Moku 16-bit signed DAC code) and its sign bit
+_VOUT_BITS = 16
+_VOUT_SIGN = 1 << (_VOUT_BITS - 1)
 
-@cocotb.test()
-async def test_reset_behavior(dut):
-    """Test 1: Reset Behavior"""
-    async def test_logic():
-        dut._log.info("=" * 80)
-        dut._log.info("Test 1: Reset Behavior")
-        dut._log.info("=" * 80)
 
-        # Setup
-        await setup_clock(dut)
-        dut.enable.value = 1
-        dut.start.value = 0
-        dut.inject_error.value = 0
-        dut.inject_fault.value = 0
-        await reset_active_low(dut, rst_signal="n_reset")
+def read_code(vout) -> int:
+    """Sample the voltage_out handle as a signed digital code
 
-        # Check outputs after reset
-        assert dut.is_idle.value == 1, "Should be in IDLE state after reset"
-        assert dut.is_running.value == 0, "Should not be running after reset"
-        assert dut.is_fault.value == 0, "Should not be faulted after reset"
+    Sign-extends the raw code directly rather than going through to_signed():
+    (raw ^ sign) - sign maps [0, 2**16) onto [-32768, 32767] without a branch.
+    Tests bind vout = dut.voltage_out once instead of re-resolving it per sample.
+    """
+    return (vout.value.to_unsigned() ^ _VOUT_SIGN) - _VOUT_SIGN
 
-        # Observer should output voltage for state 0 (IDLE = 0.0V)
-        # Note: May need +1 cycle for observer due to prev_voltage register
-        await ClockCycles(dut.clk, 2)
 
-        voltage_out = digital_to_voltage(int(dut.voltage_out.value.to_signed()))
-        expected_v = calculate_expected_voltage(0)  # State 0 = IDLE = 0.0V
+def read_voltage(vout) -> float:
+    """Sample the voltage_out handle in volts (same scaling as digital_to_voltage)"""
+    return ((vout.value.to_unsigned() ^ _VOUT_SIGN) - _VOUT_SIGN) * _INV_SCALE
 
-        dut._log.info(f"Observer voltage: {voltage_out:+.3f}V (expected {expected_v:+.3f}V)")
-        assert abs(voltage_out - expected_v) < 0.1, \
-            f"Voltage mismatch: expected {expected_v:+.3f}V, got {voltage_out:+.3f}V"
 
-        dut._log.info("✓ Reset test PASSED")
+def _code_bounds(expected_v: float, tol: float) -> Tuple[int, int]:
+    """Inclusive digital code range whose voltage lies strictly within tol of expected_v"""
+    lo = math.ceil((expected_v - tol) * _SCALE)
+    hi = math.floor((expected_v + tol) * _SCALE)
+    # Nudge the ends so the range matches abs(digital_to_voltage(code) - expected_v) < tol
+    while abs(digital_to_voltage(lo) - expected_v) >= tol:
+        lo += 1
+    while abs(digital_to_voltage(lo - 1) - expected_v) < tol:
+        lo -= 1
+    while abs(digital_to_voltage(hi) - expected_v) >= tol:
+        hi -= 1
+    while abs(digital_to_voltage(hi + 1) - expected_v) < tol:
+        hi += 1
+    return max(lo, -32768), min(hi, 32767)
 
-    await run_with_timeout(test_logic(), timeout_sec=10, test_name="test_reset_behavior")
 
+# Accepted output codes per (normal state, tolerance in V), so the common
+# "voltage is at state N" checks compare ints instead of converting to volts
+_RAW_BOUNDS = {
+    (state, tol): _code_bounds(v, tol)
+    for state, v in enumerate(_EXPECTED_V)
+    for tol in (0.1, 0.2)
+}
 
-@cocotb.test()
-async def test_normal_state_progression(dut):
-    """Test 2: Normal State Progression (Voltage Stairstep)"""
-    async def test_logic():
-        dut._log.info("=" * 80)
-        dut._log.info("Test 2: Normal State Progression (Voltage Stairstep)")
-        dut._log.info("=" * 80)
 
-        # Setup
-        await setup_clock(dut)
-        dut.enable.value = 1
-        dut.start.value = 0
-        dut.inject_error.value = 0
-        dut.inject_fault.value = 0
-        await reset_active_low(dut, rst_signal="n_reset")
-        await ClockCycles(dut.clk, 2)
-
-        # Trigger FSM progression
-        dut.start.value = 1
-        await RisingEdge(dut.clk)
-        dut.start.value = 0
-
-        # Expected state progression:
-        # IDLE(0) → REQUEST(1) → LOADING(2) → VALIDATING(3) → READY(4) → RUNNING(5)
-
-        # Wait for REQUEST state (3 cycles after start)
-        await ClockCycles(dut.clk, 5)
-
-        # Check we're in REQUEST or beyond
-        voltage = digital_to_voltage(int(dut.voltage_out.value.to_signed()))
-        dut._log.info(f"After progression start: {voltage:+.3f}V")
-        assert voltage > 0.1, "Should have progressed past IDLE"
-
-        # Wait for FSM to reach RUNNING state
-        # REQUEST: 3 cycles, LOADING: 5 cycles, VALIDATING: 3 cycles, READY: 2 cycles
-        # Total: ~15 cycles
-        await ClockCycles(dut.clk, 20)
-
-        # Should be in RUNNING state (state 5)
-        assert dut.is_running.value == 1, "Should reach RUNNING state"
+def code_near_state(code: int, state_index: int, tol: float = 0.1) -> bool:
+    """True if a signed output code is within tol volts of normal state state_index"""
+    lo, hi = _RAW_BOUNDS[state_index, tol]
+    return lo <= code <= hi
 
-        # Check observer voltage for RUNNING state
-        voltage_running = digital_to_voltage(int(dut.voltage_out.value.to_signed()))
-        expected_running = calculate_expected_voltage(5)  # State 5 = RUNNING
 
-        dut._log.info(f"RUNNING state voltage: {voltage_running:+.3f}V (expected {expected_running:+.3f}V)")
-        assert abs(voltage_running - expected_running) < 0.1, \
-            f"Voltage mismatch: expected {expected_running:+.3f}V, got {voltage_running:+.3f}V"
+# Cycles for an input change to show on voltage_out: one for the FSM state
+# register, one for the observer's output register (prev_voltage)
+OBSERVER_SETTLE_CYCLES = 2
 
-        # Verify stairstep (all positive voltages)
-        assert voltage_running > 0, "RUNNING voltage should be positive (not faulted)"
+# After reset no input change is in flight: the state register and prev_voltage
+# are both cleared asynchronously, so one settled edge is enough to read IDLE
+RESET_SETTLE_CYCLES = 1
 
-        dut._log.info("✓ Normal state progression test PASSED")
+# Per-test deadline in simulated clock cycles. No test needs more than a few
+# hundred; a hung FSM now fails after 1 ms of simulated time, not 10 s of it.
+_TEST_DEADLINE_CYCLES = 100_000
+_TEST_TIMEOUT_NS = _TEST_DEADLINE_CYCLES * DEFAULT_CLK_PERIOD_NS
 
-    await run_with_timeout(test_logic(), timeout_sec=10, test_name="test_normal_state_progression")
 
+async def fast_cycles(dut, n: int, period_ns: int = DEFAULT_CLK_PERIOD_NS):
+    """Wait n clock cycles with two scheduler wake-ups instead of one per edge
 
-@cocotb.test()
-async def test_sign_flip_fault_from_idle(dut):
-    """Test 3: Sign-Flip Fault from IDLE (State 0)"""
-    async def test_logic():
-        dut._log.info("=" * 80)
-        dut._log.info("Test 3: Sign-Flip Fault from IDLE")
-        dut._log.info("=" * 80)
+    Must be called on a rising edge (as every idle wait in this file is): sleeps
+    to the falling edge before the n-th rising edge, then syncs to that edge, so
+    it ends exactly where ClockCycles(dut.clk, n) would.
+    """
+    if n > 1:
+        await Timer((n - 1) * period_ns + period_ns // 2, units="ns")
+    await RisingEdge(dut.clk)
 
-        # Setup
-        await setup_clock(dut)
-        dut.enable.value = 1
-        dut.start.value = 0
-        dut.inject_error.value = 0
-        dut.inject_fault.value = 0
-        await reset_active_low(dut, rst_signal="n_reset")
-        await ClockCycles(dut.clk, 2)
 
-        # Capture voltage before fault (IDLE = 0.0V)
-        voltage_before = digital_to_voltage(int(dut.voltage_out.value.to_signed()))
-        dut._log.info(f"Before fault (IDLE): {voltage_before:+.3f}V")
+async def pulse(signal, clk):
+    """Drive signal high for exactly one clock cycle (strobes start/inject_*)"""
+    signal.value = 1
+    await RisingEdge(clk)
+    signal.value = 0
 
-        # Inject ERROR fault
-        dut.inject_error.value = 1
-        await RisingEdge(dut.clk)
-        dut.inject_error.value = 0
 
-        # Wait for fault to propagate (observer may need +1 cycle)
-        await ClockCycles(dut.clk, 2)
+async def fast_reset(dut, period_ns: int = DEFAULT_CLK_PERIOD_NS):
+    """Pulse the (asynchronous) n_reset low with a Timer instead of counting edges
 
-        # Check fault state
-        assert dut.is_fault.value == 1, "Should be in fault state"
+    Called on a rising edge: holds reset 2.5 cycles so the release lands on a
+    falling edge (no race with the clock), then syncs to the next rising edge,
+    ending where reset_active_low(dut, rst_signal="n_reset") would.
+    """
+    dut.n_reset.value = 0
+    await Timer(2 * period_ns + period_ns // 2, units="ns")
+    dut.n_reset.value = 1
+    await RisingEdge(dut.clk)
 
-        # Check sign-flip: voltage should be negative magnitude of previous state
-        voltage_fault = digital_to_voltage(int(dut.voltage_out.value.to_signed()))
-        dut._log.info(f"After ERROR fault: {voltage_fault:+.3f}V")
 
-        # From IDLE (0.0V), fault should show -0.0V (still ~0)
-        # This is a special case - sign-flip of 0V is still 0V
-        assert abs(voltage_fault) < 0.2, \
-            f"Fault from IDLE should be near 0V, got {voltage_fault:+.3f}V"
+async def enter_fault(dut, fault_signal, progress_cycles: int = 0):
+    """Shared fault-entry path: optionally start the FSM and run progress_cycles,
+    then strobe fault_signal (inject_error/inject_fault) and let the output settle
+    """
+    if progress_cycles:
+        await pulse(dut.start, dut.clk)
+        await fast_cycles(dut, progress_cycles)
+    await pulse(fault_signal, dut.clk)
+    await ClockCycles(dut.clk, OBSERVER_SETTLE_CYCLES)
 
-        dut._log.info("✓ Sign-flip from IDLE test PASSED")
 
-    await run_with_timeout(test_logic(), timeout_sec=10, test_name="test_sign_flip_fault_from_idle")
+def set_inputs(dut, *, enable: int = 0, start: int = 0, inject_error: int = 0,
+               inject_fault: int = 0):
+    """Drive all four FSM control inputs at once (anything not named goes low)"""
+    dut.enable.value = enable
+    dut.start.value = start
+    dut.inject_error.value = inject_error
+    dut.inject_fault.value = inject_fault
 
 
-@cocotb.test()
-async def test_sign_flip_fault_from_loading(dut):
-    """Test 4: Sign-Flip Fault from LOADING (State 2)"""
-    async def test_logic():
-        dut._log.info("=" * 80)
-        dut._log.info("Test 4: Sign-Flip Fault from LOADING")
-        dut._log.info("=" * 80)
+async def setup_fsm(dut, settle: bool = True, clock: bool = True):
+    """Common test prologue: start the clock, drive idle inputs, reset the FSM
 
-        # Setup
+    With settle=True, also waits RESET_SETTLE_CYCLES for the output to follow IDLE.
+    clock=False reuses an already running clock (later scenarios of a bundled test).
+    """
+    if clock:
         await setup_clock(dut)
-        dut.enable.value = 1
-        dut.start.value = 0
-        dut.inject_error.value = 0
-        dut.inject_fault.value = 0
-        await reset_active_low(dut, rst_signal="n_reset")
-        await ClockCycles(dut.clk, 2)
-
-        # Progress to REQUEST state
-        dut.start.value = 1
-        await RisingEdge(dut.clk)
-        dut.start.value = 0
-
-        # Wait for LOADING state (REQUEST takes 3 cycles)
-        await ClockCycles(dut.clk, 5)
-
-        # Capture voltage in LOADING state (state 2)
-        voltage_before = digital_to_voltage(int(dut.voltage_out.value.to_signed()))
-        expected_loading = calculate_expected_voltage(2)  # State 2 = LOADING
-        dut._log.info(f"Before fault (LOADING): {voltage_before:+.3f}V (expected {expected_loading:+.3f}V)")
-
-        # Inject FAULT
-        dut.inject_fault.value = 1
-        await RisingEdge(dut.clk)
-        dut.inject_fault.value = 0
-
-        # Wait for fault to propagate
-        await ClockCycles(dut.clk, 2)
-
-        # Check fault state
-        assert dut.is_fault.value == 1, "Should be in fault state"
-
-        # Check sign-flip: voltage should be NEGATIVE of LOADING voltage
-        voltage_fault = digital_to_voltage(int(dut.voltage_out.value.to_signed()))
-        dut._log.info(f"After FAULT: {voltage_fault:+.3f}V")
-        dut._log.info(f"Expected: -{abs(voltage_before):.3f}V (sign-flipped LOADING voltage)")
-
-        # Verify sign-flip
-        assert voltage_fault < 0, "Fault voltage should be negative"
-        assert abs(abs(voltage_fault) - abs(voltage_before)) < 0.2, \
-            f"Magnitude should match previous state: {abs(voltage_before):.3f}V vs {abs(voltage_fault):.3f}V"
+    set_inputs(dut, enable=1)
+    await fast_reset(dut)
+    if settle:
+        await ClockCycles(dut.clk, RESET_SETTLE_CYCLES)
+
+
+# Report text of the documentation-only tests, joined once so each logs a single record
+_CONFIGURATION_NOTES = "\n".join((
+    _BANNER,
+    "Test 18: Configuration Edge Cases (Documentation)",
+    _BANNER,
+    "Documenting untested configuration edge cases:",
+    "1. V_MIN > V_MAX (inverted voltage range):",
+    "   - Would produce DESCENDING stairstep (high→low)",
+    "   - Negative v_step in LUT calculation",
+    "   - Valid but unconventional (down = progress)",
+    "2. V_MIN = V_MAX (zero voltage range):",
+    "   - v_step = 0.0, all states at same voltage",
+    "   - Observer provides no state discrimination",
+    "   - Valid but useless configuration",
+    "3. FAULT_STATE_THRESHOLD = 0 (all states are faults):",
+    "   - num_normal = 0, LUT calculation special case",
+    "   - All voltages would be sign-flipped",
+    "   - Likely configuration error",
+    "4. FAULT_STATE_THRESHOLD = 1 (only IDLE is normal):",
+    "   - IDLE at V_MIN, all other states fault",
+    "   - Valid for 'anything but IDLE = fault' semantics",
+    "   - Useful for simple error detection",
+    "5. NUM_STATES = 1 (single-state FSM):",
+    "   - v_step calculation: (V_MAX-V_MIN)/0 → special case",
+    "   - VHDL handles: if num_normal > 1",
+    "   - State 0 maps to V_MIN",
+    "6. State vector > NUM_STATES (invalid state index):",
+    "   - Observer LUT has 64 entries (6-bit addressing)",
+    "   - States >= NUM_STATES map to MOKU_DIGITAL_ZERO",
+    "   - Failsafe: invalid states → 0.0V",
+    "7. Extreme voltage ranges (±5V limits):",
+    "   - Moku DAC range: -5V to +5V",
+    "   - voltage_to_digital() clamps to ±32768",
+    "   - Observer handles full range correctly",
+    "8. Negative voltage ranges (V_MIN=-2.5, V_MAX=-0.5):",
+    "   - Valid! Produces negative stairstep",
+    "   - Fault sign-flip makes voltage MORE negative",
+    "   - Unconventional but mathematically sound",
+    "✓ Configuration documentation test PASSED",
+    "Note: These scenarios warrant future test coverage",
+))
+
+_SUMMARY = "\n".join((
+    _BANNER,
+    "FSM Observer Pattern - Comprehensive Test Summary",
+    _BANNER,
+    "✅ ALL TESTS PASSED",
+    "Core Functionality (Tests 1-8):",
+    "  ✓ Reset behavior and initialization",
+    "  ✓ Normal state progression (voltage stairstep)",
+    "  ✓ Sign-flip fault indication from multiple states",
+    "  ✓ Automatic voltage spreading (0.0V → 2.5V)",
+    "  ✓ Fault states are sticky (reset required)",
+    "Edge Case Coverage (Tests 9-19):",
+    "  ✓ Sign-flip from 0.0V state (IDLE)",
+    "  ✓ Sign-flip from V_MAX state (RUNNING = 2.5V)",
+    "  ✓ Rapid fault entry after reset",
+    "  ✓ Multiple consecutive fault transitions",
+    "  ✓ FAULT_STATE_THRESHOLD boundary behavior",
+    "  ✓ Fault recovery via reset",
+    "  ✓ Complete fault/recovery lifecycle",
+    "  ✓ FSM disabled (enable=0) during observation",
+    "  ✓ State transition timing and spacing",
+    "  ✓ Rapid state changes and stress testing",
+    "Configuration Documentation (Test 18):",
+    "  ✓ Inverted voltage ranges (V_MIN > V_MAX)",
+    "  ✓ Zero voltage range (V_MIN = V_MAX)",
+    "  ✓ Extreme fault thresholds (0, 1, NUM_STATES)",
+    "  ✓ Invalid state indices handling",
+    "  ✓ Voltage range limits (±5V)",
+    "  ✓ Negative voltage range configurations",
+    "Key Design Validations:",
+    "  ✓ Observer is non-invasive (FSM unchanged)",
+    "  ✓ prev_voltage register updates only in normal states",
+    "  ✓ Sign-flip preserves debugging context (magnitude)",
+    "  ✓ LUT failsafe (invalid states → 0.0V)",
+    "  ✓ Single-cycle state transition tracking",
+    _BANNER,
+    "Pattern validated and ready for production deployment!",
+    _BANNER,
+))
 
-        dut._log.info("✓ Sign-flip from LOADING test PASSED")
 
-    await run_with_timeout(test_logic(), timeout_sec=10, test_name="test_sign_flip_fault_from_loading")
+# ============================================================================
+# Tests
+# ============================================================================
 
+@cocotb.test(timeout_time=_TEST_TIMEOUT_NS, timeout_unit="ns")
+async def test_reset_behavior(dut):
+    """Test 1: Reset Behavior"""
+    dut._log.info(_BANNER)
+    dut._log.info("Test 1: Reset Behavior")
+    dut._log.info(_BANNER)
 
-@cocotb.test()
-async def test_sign_flip_fault_from_validating(dut):
-    """Test 5: Sign-Flip Fault from VALIDATING (State 3)"""
-    async def test_logic():
-        dut._log.info("=" * 80)
-        dut._log.info("Test 5: Sign-Flip Fault from VALIDATING")
-        dut._log.info("=" * 80)
+    # Setup
+    await setup_fsm(dut, settle=False)
+    vout = dut.voltage_out
 
-        # Setup
-        await setup_clock(dut)
-        dut.enable.value = 1
-        dut.start.value = 0
-        dut.inject_error.value = 0
-        dut.inject_fault.value = 0
-        await reset_active_low(dut, rst_signal="n_reset")
-        await ClockCycles(dut.clk, 2)
-
-        # Progress to VALIDATING state
-        dut.start.value = 1
-        await RisingEdge(dut.clk)
-        dut.start.value = 0
-
-        # Wait for VALIDATING (REQUEST: 3, LOADING: 5, total ~10 cycles)
-        await ClockCycles(dut.clk, 12)
-
-        # Capture voltage in VALIDATING state
-        voltage_before = digital_to_voltage(int(dut.voltage_out.value.to_signed()))
-        expected_validating = calculate_expected_voltage(3)  # State 3
-        dut._log.info(f"Before fault (VALIDATING): {voltage_before:+.3f}V (expected {expected_validating:+.3f}V)")
-
-        # Inject ERROR fault
-        dut.inject_error.value = 1
-        await RisingEdge(dut.clk)
-        dut.inject_error.value = 0
-
-        # Wait for fault to propagate
-        await ClockCycles(dut.clk, 2)
-
-        # Check fault state
-        assert dut.is_fault.value == 1, "Should be in fault state"
-
-        # Check sign-flip
-        voltage_fault = digital_to_voltage(int(dut.voltage_out.value.to_signed()))
-        dut._log.info(f"After ERROR: {voltage_fault:+.3f}V")
-        dut._log.info(f"Sign-flip preserves magnitude: {abs(voltage_before):.3f}V → -{abs(voltage_before):.3f}V")
-
-        # Verify sign-flip
-        assert voltage_fault < 0, "Fault voltage should be negative"
-        assert abs(abs(voltage_fault) - abs(voltage_before)) < 0.2, \
-            f"Magnitude mismatch: {abs(voltage_before):.3f}V vs {abs(voltage_fault):.3f}V"
+    # Check outputs after reset
+    assert dut.is_idle.value == 1, "Should be in IDLE state after reset"
+    assert dut.is_running.value == 0, "Should not be running after reset"
+    assert dut.is_fault.value == 0, "Should not be faulted after reset"
+
+    # Observer should output voltage for state 0 (IDLE = 0.0V)
+    # Note: May need +1 cycle for observer due to prev_voltage register
+    await ClockCycles(dut.clk, OBSERVER_SETTLE_CYCLES)
+
+    code_out = read_code(vout)
+    voltage_out = code_out * _INV_SCALE
+    expected_v = _EXPECTED_V[0]  # State 0 = IDLE = 0.0V
+
+    dut._log.info(f"Observer voltage: {voltage_out:+.3f}V (expected {expected_v:+.3f}V)")
+    assert code_near_state(code_out, 0), \
+        f"Voltage mismatch: expected {expected_v:+.3f}V, got {voltage_out:+.3f}V"
+
+    dut._log.info("✓ Reset test PASSED")
+
+
+@cocotb.test(timeout_time=_TEST_TIMEOUT_NS, timeout_unit="ns")
+async def test_normal_state_progression(dut):
+    """Test 2: Normal State Progression (Voltage Stairstep)"""
+    dut._log.info(_BANNER)
+    dut._log.info("Test 2: Normal State Progression (Voltage Stairstep)")
+    dut._log.info(_BANNER)
+
+    # Setup
+    await setup_fsm(dut)
+    vout = dut.voltage_out
+
+    # Trigger FSM progression
+    await pulse(dut.start, dut.clk)
+
+    # Expected state progression:
+    # IDLE(0) → REQUEST(1) → LOADING(2) → VALIDATING(3) → READY(4) → RUNNING(5)
+
+    # Wait for REQUEST state (3 cycles after start)
+    await fast_cycles(dut, 5)
+
+    # Check we're in REQUEST or beyond
+    voltage = read_voltage(vout)
+    dut._log.info(f"After progression start: {voltage:+.3f}V")
+    assert voltage > 0.1, "Should have progressed past IDLE"
+
+    # Wait for FSM to reach RUNNING state
+    # REQUEST: 3 cycles, LOADING: 5 cycles, VALIDATING: 3 cycles, READY: 2 cycles
+    # Total: ~15 cycles
+    await fast_cycles(dut, 20)
+
+    # Should be in RUNNING state (state 5)
+    assert dut.is_running.value == 1, "Should reach RUNNING state"
+
+    # Check observer voltage for RUNNING state
+    code_running = read_code(vout)
+    voltage_running = code_running * _INV_SCALE
+    expected_running = _EXPECTED_V[5]  # State 5 = RUNNING
+
+    dut._log.info(f"RUNNING state voltage: {voltage_running:+.3f}V (expected {expected_running:+.3f}V)")
+    assert code_near_state(code_running, 5), \
+        f"Voltage mismatch: expected {expected_running:+.3f}V, got {voltage_running:+.3f}V"
+
+    # Verify stairstep (all positive voltages)
+    assert voltage_running > 0, "RUNNING voltage should be positive (not faulted)"
+
+    dut._log.info("✓ Normal state progression test PASSED")
+
+
+@cocotb.test(timeout_time=_TEST_TIMEOUT_NS, timeout_unit="ns")
+@cocotb.parametrize(
+    (("state", "state_index", "progress_cycles", "fault_input"), _SIGN_FLIP_CASES)
+)
+async def test_sign_flip_fault(dut, state, state_index, progress_cycles, fault_input):
+    """Tests 3-5, 10: Sign-Flip Fault from IDLE, LOADING, VALIDATING and RUNNING (V_MAX)"""
+    dut._log.info(_BANNER)
+    dut._log.info(f"Sign-Flip Fault from {state} (state {state_index}) via {fault_input}")
+    dut._log.info(_BANNER)
+
+    # Setup
+    await setup_fsm(dut)
+    vout = dut.voltage_out
+
+    # Progress to the source state
+    if progress_cycles:
+        await pulse(dut.start, dut.clk)
+        await fast_cycles(dut, progress_cycles)
+
+    # Capture voltage before fault
+    code_before = read_code(vout)
+    voltage_before = code_before * _INV_SCALE
+    expected_before = _EXPECTED_V[state_index]
+    dut._log.info(f"Before fault ({state}): {voltage_before:+.3f}V "
+                  f"(expected {expected_before:+.3f}V)")
+    if state_index == len(_EXPECTED_V) - 1:
+        # Last normal state: check we really are at V_MAX before faulting
+        assert dut.is_running.value == 1, "Should reach RUNNING state"
+        assert code_near_state(code_before, state_index), f"Should be at V_MAX ({V_MAX}V)"
+
+    # Inject the fault and wait for it to propagate (observer may need +1 cycle)
+    await enter_fault(dut, getattr(dut, fault_input))
+
+    # Check fault state
+    assert dut.is_fault.value == 1, "Should be in fault state"
 
-        dut._log.info("✓ Sign-flip from VALIDATING test PASSED")
+    # Check sign-flip: voltage should be negative magnitude of previous state
+    voltage_fault = read_voltage(vout)
+    dut._log.info(f"After {fault_input}: {voltage_fault:+.3f}V "
+                  f"(expected -{abs(voltage_before):.3f}V)")
+
+    # From IDLE (0.0V) the sign-flip is still ~0V, so only check the sign above it
+    if state_index:
+        assert voltage_fault < 0, "Fault voltage should be negative"
+    assert abs(abs(voltage_fault) - abs(voltage_before)) < 0.2, \
+        f"Magnitude should match previous state: {abs(voltage_before):.3f}V vs {abs(voltage_fault):.3f}V"
 
-    await run_with_timeout(test_logic(), timeout_sec=10, test_name="test_sign_flip_fault_from_validating")
+    dut._log.info(f"✓ Sign-flip from {state} test PASSED")
 
 
-@cocotb.test()
+@cocotb.test(timeout_time=_TEST_TIMEOUT_NS, timeout_unit="ns")
 async def test_automatic_voltage_spreading(dut):
     """Test 6: Verify Automatic Voltage Spreading"""
-    async def test_logic():
-        dut._log.info("=" * 80)
-        dut._log.info("Test 6: Automatic Voltage Spreading")
-        dut._log.info("=" * 80)
+    dut._log.info(_BANNER)
+    dut._log.info("Test 6: Automatic Voltage Spreading")
+    dut._log.info(_BANNER)
 
-        # Setup
-        await setup_clock(dut)
-        dut.enable.value = 1
-        dut.start.value = 0
-        dut.inject_error.value = 0
-        dut.inject_fault.value = 0
-        await reset_active_low(dut, rst_signal="n_reset")
-        await ClockCycles(dut.clk, 2)
-
-        # Check IDLE voltage (state 0)
-        voltage_idle = digital_to_voltage(int(dut.voltage_out.value.to_signed()))
-        expected_idle = 0.0  # V_MIN
-        dut._log.info(f"State 0 (IDLE): {voltage_idle:+.3f}V (expected {expected_idle:+.3f}V)")
+    # Setup
+    await setup_fsm(dut)
+    vout = dut.voltage_out
 
-        # Progress through states and check voltage spreading
-        dut.start.value = 1
-        await RisingEdge(dut.clk)
-        dut.start.value = 0
+    # Check IDLE voltage (state 0)
+    code_idle = read_code(vout)
+    voltage_idle = code_idle * _INV_SCALE
+    expected_idle = V_MIN
+    dut._log.info(f"State 0 (IDLE): {voltage_idle:+.3f}V (expected {expected_idle:+.3f}V)")
 
-        # Reach RUNNING (state 5)
-        await ClockCycles(dut.clk, 20)
+    # Progress through states and check voltage spreading
+    await pulse(dut.start, dut.clk)
 
-        voltage_running = digital_to_voltage(int(dut.voltage_out.value.to_signed()))
-        expected_running = 2.5  # V_MAX (state 5 is last normal state before faults)
-        dut._log.info(f"State 5 (RUNNING): {voltage_running:+.3f}V (expected {expected_running:+.3f}V)")
+    # Reach RUNNING (state 5)
+    await fast_cycles(dut, 20)
 
-        # Calculate expected voltage step
-        # 6 normal states (0-5), spread over 0.0V to 2.5V
-        # Step = 2.5 / (6-1) = 0.5V
-        expected_step = 2.5 / 5  # 0.5V
-        dut._log.info(f"Expected voltage step: {expected_step:.3f}V")
+    code_running = read_code(vout)
+    voltage_running = code_running * _INV_SCALE
+    expected_running = V_MAX  # State 5 is the last normal state before faults
+    dut._log.info(f"State 5 (RUNNING): {voltage_running:+.3f}V (expected {expected_running:+.3f}V)")
 
-        # Verify automatic spreading
-        assert abs(voltage_idle - expected_idle) < 0.1, "IDLE voltage incorrect"
-        assert abs(voltage_running - expected_running) < 0.1, "RUNNING voltage incorrect"
+    # Calculate expected voltage step
+    # 6 normal states (0-5), spread over 0.0V to 2.5V
+    # Step = 2.5 / (6-1) = 0.5V
+    expected_step = _EXPECTED_STEP
+    dut._log.info(f"Expected voltage step: {expected_step:.3f}V")
 
-        dut._log.info("✓ Automatic voltage spreading test PASSED")
+    # Verify automatic spreading
+    assert code_near_state(code_idle, 0), "IDLE voltage incorrect"
+    assert code_near_state(code_running, 5), "RUNNING voltage incorrect"
 
-    await run_with_timeout(test_logic(), timeout_sec=10, test_name="test_automatic_voltage_spreading")
+    dut._log.info("✓ Automatic voltage spreading test PASSED")
 
 
-@cocotb.test()
+@cocotb.test(timeout_time=_TEST_TIMEOUT_NS, timeout_unit="ns")
 async def test_fault_is_sticky(dut):
     """Test 7: Fault States Are Sticky"""
-    async def test_logic():
-        dut._log.info("=" * 80)
-        dut._log.info("Test 7: Fault States Are Sticky")
-        dut._log.info("=" * 80)
+    dut._log.info(_BANNER)
+    dut._log.info("Test 7: Fault States Are Sticky")
+    dut._log.info(_BANNER)
 
-        # Setup
-        await setup_clock(dut)
-        dut.enable.value = 1
-        dut.start.value = 0
-        dut.inject_error.value = 0
-        dut.inject_fault.value = 0
-        await reset_active_low(dut, rst_signal="n_reset")
-        await ClockCycles(dut.clk, 2)
+    # Setup
+    await setup_fsm(dut)
+    vout = dut.voltage_out
 
-        # Inject fault
-        dut.inject_error.value = 1
-        await RisingEdge(dut.clk)
-        dut.inject_error.value = 0
-        await ClockCycles(dut.clk, 2)
+    # Inject fault
+    await enter_fault(dut, dut.inject_error)
 
-        # Check fault state
-        assert dut.is_fault.value == 1, "Should be faulted"
-        voltage_fault = digital_to_voltage(int(dut.voltage_out.value.to_signed()))
-        dut._log.info(f"In fault state: {voltage_fault:+.3f}V")
+    # Check fault state
+    assert dut.is_fault.value == 1, "Should be faulted"
+    voltage_fault = read_voltage(vout)
+    dut._log.info(f"In fault state: {voltage_fault:+.3f}V")
 
-        # Try to trigger state progression (should stay in fault)
-        dut.start.value = 1
-        await RisingEdge(dut.clk)
-        dut.start.value = 0
-        await ClockCycles(dut.clk, 5)
+    # Try to trigger state progression (should stay in fault)
+    await pulse(dut.start, dut.clk)
+    await fast_cycles(dut, 5)
 
-        # Should still be faulted
-        assert dut.is_fault.value == 1, "Fault should be sticky"
-        voltage_still_fault = digital_to_voltage(int(dut.voltage_out.value.to_signed()))
-        dut._log.info(f"Still in fault state: {voltage_still_fault:+.3f}V")
+    # Should still be faulted
+    assert dut.is_fault.value == 1, "Fault should be sticky"
+    voltage_still_fault = read_voltage(vout)
+    dut._log.info(f"Still in fault state: {voltage_still_fault:+.3f}V")
 
-        # Voltage should remain negative
-        assert voltage_still_fault < 0, "Fault voltage should remain negative"
+    # Voltage should remain negative
+    assert voltage_still_fault < 0, "Fault voltage should remain negative"
 
-        dut._log.info("✓ Sticky fault test PASSED")
+    dut._log.info("✓ Sticky fault test PASSED")
 
-    await run_with_timeout(test_logic(), timeout_sec=10, test_name="test_fault_is_sticky")
 
-
-@cocotb.test()
+@cocotb.test(timeout_time=_TEST_TIMEOUT_NS, timeout_unit="ns")
 async def test_edge_case_zero_voltage_from_fault(dut):
     """Test 9: Edge Case - Sign-flip when previous state was 0.0V (IDLE)"""
-    async def test_logic():
-        dut._log.info("=" * 80)
-        dut._log.info("Test 9: Edge Case - Sign-Flip from 0.0V State")
-        dut._log.info("=" * 80)
-
-        # Setup
-        await setup_clock(dut)
-        dut.enable.value = 1
-        dut.start.value = 0
-        dut.inject_error.value = 0
-        dut.inject_fault.value = 0
-        await reset_active_low(dut, rst_signal="n_reset")
-        await ClockCycles(dut.clk, 2)
-
-        # Verify we're in IDLE (0.0V)
-        voltage_idle = digital_to_voltage(int(dut.voltage_out.value.to_signed()))
-        assert abs(voltage_idle) < 0.1, "Should start at IDLE (0.0V)"
-        dut._log.info(f"IDLE voltage: {voltage_idle:+.3f}V")
-
-        # Inject ERROR from IDLE (edge case: sign-flip of 0.0V)
-        dut.inject_error.value = 1
-        await RisingEdge(dut.clk)
-        dut.inject_error.value = 0
-        await ClockCycles(dut.clk, 2)
-
-        # Check fault state
-        assert dut.is_fault.value == 1, "Should be in fault state"
-        voltage_fault = digital_to_voltage(int(dut.voltage_out.value.to_signed()))
-        dut._log.info(f"ERROR from IDLE: {voltage_fault:+.3f}V")
-
-        # Edge case: -0.0V is still 0.0V (sign-flip of zero is zero)
-        assert abs(voltage_fault) < 0.2, \
-            f"Sign-flip of 0.0V should still be ~0.0V, got {voltage_fault:+.3f}V"
-
-        dut._log.info("✓ Edge case (zero voltage fault) test PASSED")
-        dut._log.info("Note: Sign-flip of 0.0V = 0.0V (expected behavior)")
-
-    await run_with_timeout(test_logic(), timeout_sec=10, test_name="test_edge_case_zero_voltage_from_fault")
-
-
-@cocotb.test()
-async def test_edge_case_max_voltage_fault(dut):
-    """Test 10: Edge Case - Sign-flip from maximum voltage state (RUNNING = 2.5V)"""
-    async def test_logic():
-        dut._log.info("=" * 80)
-        dut._log.info("Test 10: Edge Case - Sign-Flip from V_MAX State")
-        dut._log.info("=" * 80)
-
-        # Setup
-        await setup_clock(dut)
-        dut.enable.value = 1
-        dut.start.value = 0
-        dut.inject_error.value = 0
-        dut.inject_fault.value = 0
-        await reset_active_low(dut, rst_signal="n_reset")
-        await ClockCycles(dut.clk, 2)
-
-        # Progress to RUNNING state (state 5 = V_MAX = 2.5V)
-        dut.start.value = 1
-        await RisingEdge(dut.clk)
-        dut.start.value = 0
-
-        # Wait for RUNNING state
-        # REQUEST: 3 cycles, LOADING: 5, VALIDATING: 3, READY: 2 = ~15 cycles
-        await ClockCycles(dut.clk, 20)
-        assert dut.is_running.value == 1, "Should reach RUNNING state"
+    dut._log.info(_BANNER)
+    dut._log.info("Test 9: Edge Case - Sign-Flip from 0.0V State")
+    dut._log.info(_BANNER)
 
-        # Capture voltage before fault (should be V_MAX = 2.5V)
-        voltage_before = digital_to_voltage(int(dut.voltage_out.value.to_signed()))
-        dut._log.info(f"RUNNING voltage: {voltage_before:+.3f}V")
-        assert abs(voltage_before - 2.5) < 0.1, "Should be at V_MAX (2.5V)"
+    # Setup
+    await setup_fsm(dut)
+    vout = dut.voltage_out
 
-        # Inject FAULT from RUNNING
-        dut.inject_fault.value = 1
-        await RisingEdge(dut.clk)
-        dut.inject_fault.value = 0
-        await ClockCycles(dut.clk, 2)
+    # Verify we're in IDLE (0.0V)
+    code_idle = read_code(vout)
+    voltage_idle = code_idle * _INV_SCALE
+    assert code_near_state(code_idle, 0), "Should start at IDLE (0.0V)"
+    dut._log.info(f"IDLE voltage: {voltage_idle:+.3f}V")
 
-        # Check sign-flip: should be -2.5V (negative V_MAX)
-        voltage_fault = digital_to_voltage(int(dut.voltage_out.value.to_signed()))
-        dut._log.info(f"FAULT from RUNNING: {voltage_fault:+.3f}V")
+    # Inject ERROR from IDLE (edge case: sign-flip of 0.0V)
+    await enter_fault(dut, dut.inject_error)
 
-        assert voltage_fault < 0, "Fault voltage should be negative"
-        assert abs(abs(voltage_fault) - 2.5) < 0.2, \
-            f"Should be -2.5V (sign-flip of V_MAX), got {voltage_fault:+.3f}V"
+    # Check fault state
+    assert dut.is_fault.value == 1, "Should be in fault state"
+    code_fault = read_code(vout)
+    voltage_fault = code_fault * _INV_SCALE
+    dut._log.info(f"ERROR from IDLE: {voltage_fault:+.3f}V")
 
-        dut._log.info("✓ Edge case (max voltage fault) test PASSED")
+    # Edge case: -0.0V is still 0.0V (sign-flip of zero is zero)
+    assert code_near_state(code_fault, 0, tol=0.2), \
+        f"Sign-flip of 0.0V should still be ~0.0V, got {voltage_fault:+.3f}V"
 
-    await run_with_timeout(test_logic(), timeout_sec=10, test_name="test_edge_case_max_voltage_fault")
+    dut._log.info("✓ Edge case (zero voltage fault) test PASSED")
+    dut._log.info("Note: Sign-flip of 0.0V = 0.0V (expected behavior)")
 
 
-@cocotb.test()
+@cocotb.test(timeout_time=_TEST_TIMEOUT_NS, timeout_unit="ns")
 async def test_edge_case_rapid_fault_entry(dut):
     """Test 11: Edge Case - Rapid entry into fault without settling in normal state"""
-    async def test_logic():
-        dut._log.info("=" * 80)
-        dut._log.info("Test 11: Edge Case - Rapid Fault Entry")
-        dut._log.info("=" * 80)
-
-        # Setup
-        await setup_clock(dut)
-        dut.enable.value = 1
-        dut.start.value = 0
-        dut.inject_error.value = 0
-        dut.inject_fault.value = 0
-        await reset_active_low(dut, rst_signal="n_reset")
+    dut._log.info(_BANNER)
+    dut._log.info("Test 11: Edge Case - Rapid Fault Entry")
+    dut._log.info(_BANNER)
 
-        # Immediately inject fault after reset (within 1 cycle)
-        await RisingEdge(dut.clk)
-        dut.inject_error.value = 1
-        await RisingEdge(dut.clk)
-        dut.inject_error.value = 0
-        await ClockCycles(dut.clk, 2)
+    # Setup
+    await setup_fsm(dut, settle=False)
+    vout = dut.voltage_out
 
-        # Should fault from IDLE (prev_voltage should be IDLE = 0.0V)
-        assert dut.is_fault.value == 1, "Should be in fault state"
-        voltage_fault = digital_to_voltage(int(dut.voltage_out.value.to_signed()))
-        dut._log.info(f"Rapid fault entry: {voltage_fault:+.3f}V")
+    # Immediately inject fault after reset (within 1 cycle)
+    await RisingEdge(dut.clk)
+    await enter_fault(dut, dut.inject_error)
 
-        # Should be near 0V (faulted from IDLE)
-        assert abs(voltage_fault) < 0.2, \
-            f"Rapid fault should capture IDLE (0.0V), got {voltage_fault:+.3f}V"
+    # Should fault from IDLE (prev_voltage should be IDLE = 0.0V)
+    assert dut.is_fault.value == 1, "Should be in fault state"
+    code_fault = read_code(vout)
+    voltage_fault = code_fault * _INV_SCALE
+    dut._log.info(f"Rapid fault entry: {voltage_fault:+.3f}V")
 
-        dut._log.info("✓ Edge case (rapid fault entry) test PASSED")
-        dut._log.info("Note: prev_voltage register captures state before fault")
+    # Should be near 0V (faulted from IDLE)
+    assert code_near_state(code_fault, 0, tol=0.2), \
+        f"Rapid fault should capture IDLE (0.0V), got {voltage_fault:+.3f}V"
 
-    await run_with_timeout(test_logic(), timeout_sec=10, test_name="test_edge_case_rapid_fault_entry")
+    dut._log.info("✓ Edge case (rapid fault entry) test PASSED")
+    dut._log.info("Note: prev_voltage register captures state before fault")
 
 
-@cocotb.test()
+@cocotb.test(timeout_time=_TEST_TIMEOUT_NS, timeout_unit="ns")
 async def test_edge_case_multiple_consecutive_faults(dut):
     """Test 12: Edge Case - Transition between fault states (ERROR → FAULT)"""
-    async def test_logic():
-        dut._log.info("=" * 80)
-        dut._log.info("Test 12: Edge Case - Multiple Consecutive Faults")
-        dut._log.info("=" * 80)
+    dut._log.info(_BANNER)
+    dut._log.info("Test 12: Edge Case - Multiple Consecutive Faults")
+    dut._log.info(_BANNER)
 
-        # Setup and progress to LOADING state
-        await setup_clock(dut)
-        dut.enable.value = 1
-        dut.start.value = 0
-        dut.inject_error.value = 0
-        dut.inject_fault.value = 0
-        await reset_active_low(dut, rst_signal="n_reset")
-        await ClockCycles(dut.clk, 2)
-
-        # Progress to LOADING (state 2)
-        dut.start.value = 1
-        await RisingEdge(dut.clk)
-        dut.start.value = 0
-        await ClockCycles(dut.clk, 5)
-
-        # Capture LOADING voltage
-        voltage_loading = digital_to_voltage(int(dut.voltage_out.value.to_signed()))
-        dut._log.info(f"LOADING voltage: {voltage_loading:+.3f}V")
-
-        # Enter ERROR state (fault state 6)
-        dut.inject_error.value = 1
-        await RisingEdge(dut.clk)
-        dut.inject_error.value = 0
-        await ClockCycles(dut.clk, 2)
-
-        voltage_error = digital_to_voltage(int(dut.voltage_out.value.to_signed()))
-        dut._log.info(f"ERROR state: {voltage_error:+.3f}V")
-        assert voltage_error < 0, "ERROR should have negative voltage"
-
-        # Now transition to FAULT state (fault state 7)
-        # This is fault → fault transition
-        dut.inject_fault.value = 1
-        await RisingEdge(dut.clk)
-        dut.inject_fault.value = 0
-        await ClockCycles(dut.clk, 2)
-
-        voltage_fault = digital_to_voltage(int(dut.voltage_out.value.to_signed()))
-        dut._log.info(f"FAULT state (from ERROR): {voltage_fault:+.3f}V")
-
-        # Should preserve the same voltage (prev_voltage not updated in fault states)
-        assert abs(voltage_fault - voltage_error) < 0.1, \
-            "Fault→Fault transition should preserve voltage"
-
-        dut._log.info("✓ Edge case (consecutive faults) test PASSED")
-        dut._log.info("Note: prev_voltage only updates in NORMAL states")
-
-    await run_with_timeout(test_logic(), timeout_sec=10, test_name="test_edge_case_multiple_consecutive_faults")
-
-
-@cocotb.test()
+    # Setup and progress to LOADING state
+    await setup_fsm(dut)
+    vout = dut.voltage_out
+
+    # Progress to LOADING (state 2)
+    await pulse(dut.start, dut.clk)
+    await fast_cycles(dut, 5)
+
+    # Capture LOADING voltage
+    voltage_loading = read_voltage(vout)
+    dut._log.info(f"LOADING voltage: {voltage_loading:+.3f}V")
+
+    # Enter ERROR state (fault state 6)
+    await enter_fault(dut, dut.inject_error)
+
+    voltage_error = read_voltage(vout)
+    dut._log.info(f"ERROR state: {voltage_error:+.3f}V")
+    assert voltage_error < 0, "ERROR should have negative voltage"
+
+    # Now transition to FAULT state (fault state 7)
+    # This is fault → fault transition
+    await enter_fault(dut, dut.inject_fault)
+
+    voltage_fault = read_voltage(vout)
+    dut._log.info(f"FAULT state (from ERROR): {voltage_fault:+.3f}V")
+
+    # Should preserve the same voltage (prev_voltage not updated in fault states)
+    assert abs(voltage_fault - voltage_error) < 0.1, \
+        "Fault→Fault transition should preserve voltage"
+
+    dut._log.info("✓ Edge case (consecutive faults) test PASSED")
+    dut._log.info("Note: prev_voltage only updates in NORMAL states")
+
+
+@cocotb.test(timeout_time=_TEST_TIMEOUT_NS, timeout_unit="ns")
 async def test_edge_case_fault_threshold_boundary(dut):
     """Test 13: Edge Case - States exactly at FAULT_STATE_THRESHOLD boundary"""
-    async def test_logic():
-        dut._log.info("=" * 80)
-        dut._log.info("Test 13: Edge Case - Fault Threshold Boundary (State 5 vs 6)")
-        dut._log.info("=" * 80)
+    dut._log.info(_BANNER)
+    dut._log.info("Test 13: Edge Case - Fault Threshold Boundary (State 5 vs 6)")
+    dut._log.info(_BANNER)
 
-        # Setup
-        await setup_clock(dut)
-        dut.enable.value = 1
-        dut.start.value = 0
-        dut.inject_error.value = 0
-        dut.inject_fault.value = 0
-        await reset_active_low(dut, rst_signal="n_reset")
-        await ClockCycles(dut.clk, 2)
-
-        # FAULT_STATE_THRESHOLD = 6 means:
-        # States 0-5: Normal (positive voltage)
-        # States 6-7: Fault (sign-flip)
-
-        # Progress to RUNNING (state 5 = last normal state)
-        dut.start.value = 1
-        await RisingEdge(dut.clk)
-        dut.start.value = 0
-        await ClockCycles(dut.clk, 20)
-        assert dut.is_running.value == 1, "Should reach RUNNING (state 5)"
-
-        voltage_state5 = digital_to_voltage(int(dut.voltage_out.value.to_signed()))
-        dut._log.info(f"State 5 (RUNNING, last normal): {voltage_state5:+.3f}V")
-        assert voltage_state5 > 0, "State 5 should be POSITIVE (normal state)"
-        assert dut.is_fault.value == 0, "State 5 should NOT be fault"
-
-        # Now inject ERROR (state 6 = first fault state)
-        dut.inject_error.value = 1
-        await RisingEdge(dut.clk)
-        dut.inject_error.value = 0
-        await ClockCycles(dut.clk, 2)
-
-        voltage_state6 = digital_to_voltage(int(dut.voltage_out.value.to_signed()))
-        dut._log.info(f"State 6 (ERROR, first fault): {voltage_state6:+.3f}V")
-        assert voltage_state6 < 0, "State 6 should be NEGATIVE (fault state)"
-        assert dut.is_fault.value == 1, "State 6 should BE fault"
-
-        dut._log.info("✓ Edge case (fault threshold boundary) test PASSED")
-        dut._log.info(f"Note: Threshold at {6} correctly separates normal/fault states")
-
-    await run_with_timeout(test_logic(), timeout_sec=10, test_name="test_edge_case_fault_threshold_boundary")
-
-
-@cocotb.test()
+    # Setup
+    await setup_fsm(dut)
+    vout = dut.voltage_out
+
+    # FAULT_STATE_THRESHOLD = 6 means:
+    # States 0-5: Normal (positive voltage)
+    # States 6-7: Fault (sign-flip)
+
+    # Progress to RUNNING (state 5 = last normal state)
+    await pulse(dut.start, dut.clk)
+    await fast_cycles(dut, 20)
+    assert dut.is_running.value == 1, "Should reach RUNNING (state 5)"
+
+    voltage_state5 = read_voltage(vout)
+    dut._log.info(f"State 5 (RUNNING, last normal): {voltage_state5:+.3f}V")
+    assert voltage_state5 > 0, "State 5 should be POSITIVE (normal state)"
+    assert dut.is_fault.value == 0, "State 5 should NOT be fault"
+
+    # Now inject ERROR (state 6 = first fault state)
+    await enter_fault(dut, dut.inject_error)
+
+    voltage_state6 = read_voltage(vout)
+    dut._log.info(f"State 6 (ERROR, first fault): {voltage_state6:+.3f}V")
+    assert voltage_state6 < 0, "State 6 should be NEGATIVE (fault state)"
+    assert dut.is_fault.value == 1, "State 6 should BE fault"
+
+    dut._log.info("✓ Edge case (fault threshold boundary) test PASSED")
+    dut._log.info(f"Note: Threshold at {6} correctly separates normal/fault states")
+
+
+@cocotb.test(timeout_time=_TEST_TIMEOUT_NS, timeout_unit="ns")
 async def test_edge_case_recovery_from_fault(dut):
     """Test 14: Edge Case - Recovery from fault to normal state (reset required)"""
-    async def test_logic():
-        dut._log.info("=" * 80)
-        dut._log.info("Test 14: Edge Case - Recovery from Fault")
-        dut._log.info("=" * 80)
+    dut._log.info(_BANNER)
+    dut._log.info("Test 14: Edge Case - Recovery from Fault")
+    dut._log.info(_BANNER)
 
-        # Setup and enter fault state
-        await setup_clock(dut)
-        dut.enable.value = 1
-        dut.start.value = 0
-        dut.inject_error.value = 0
-        dut.inject_fault.value = 0
-        await reset_active_low(dut, rst_signal="n_reset")
-        await ClockCycles(dut.clk, 2)
-
-        # Progress to LOADING then fault
-        dut.start.value = 1
-        await RisingEdge(dut.clk)
-        dut.start.value = 0
-        await ClockCycles(dut.clk, 5)
-
-        dut.inject_error.value = 1
-        await RisingEdge(dut.clk)
-        dut.inject_error.value = 0
-        await ClockCycles(dut.clk, 2)
-
-        # Verify in fault
-        voltage_fault = digital_to_voltage(int(dut.voltage_out.value.to_signed()))
-        dut._log.info(f"In fault state: {voltage_fault:+.3f}V")
-        assert voltage_fault < 0, "Should be in fault (negative voltage)"
-        assert dut.is_fault.value == 1, "is_fault should be high"
-
-        # Attempt to clear fault by removing inject signals (won't work - sticky)
-        dut.inject_error.value = 0
-        dut.inject_fault.value = 0
-        await ClockCycles(dut.clk, 10)
-
-        voltage_still_fault = digital_to_voltage(int(dut.voltage_out.value.to_signed()))
-        dut._log.info(f"After waiting (no reset): {voltage_still_fault:+.3f}V")
-        assert dut.is_fault.value == 1, "Fault should be sticky (no clear without reset)"
-
-        # Now reset to recover
-        await reset_active_low(dut, rst_signal="n_reset")
-        await ClockCycles(dut.clk, 2)
-
-        voltage_recovered = digital_to_voltage(int(dut.voltage_out.value.to_signed()))
-        dut._log.info(f"After reset: {voltage_recovered:+.3f}V")
-        assert abs(voltage_recovered) < 0.1, "Should recover to IDLE (0.0V)"
-        assert dut.is_fault.value == 0, "is_fault should clear after reset"
-        assert dut.is_idle.value == 1, "Should return to IDLE"
-
-        dut._log.info("✓ Edge case (fault recovery) test PASSED")
-        dut._log.info("Note: Faults are sticky - only reset clears them")
-
-    await run_with_timeout(test_logic(), timeout_sec=10, test_name="test_edge_case_recovery_from_fault")
-
-
-@cocotb.test()
-async def test_edge_case_normal_to_fault_to_normal(dut):
-    """Test 15: Edge Case - Full cycle: normal → fault → reset → normal"""
-    async def test_logic():
-        dut._log.info("=" * 80)
-        dut._log.info("Test 15: Edge Case - Complete Fault/Recovery Cycle")
-        dut._log.info("=" * 80)
+    # Setup and enter fault state
+    await setup_fsm(dut)
+    vout = dut.voltage_out
 
-        await setup_clock(dut)
-        dut.enable.value = 1
-        dut.start.value = 0
-        dut.inject_error.value = 0
-        dut.inject_fault.value = 0
+    # Progress to LOADING then fault
+    await enter_fault(dut, dut.inject_error, progress_cycles=5)
 
-        # Cycle 1: Start in normal state
-        await reset_active_low(dut, rst_signal="n_reset")
-        await ClockCycles(dut.clk, 2)
+    # Verify in fault
+    voltage_fault = read_voltage(vout)
+    dut._log.info(f"In fault state: {voltage_fault:+.3f}V")
+    assert voltage_fault < 0, "Should be in fault (negative voltage)"
+    assert dut.is_fault.value == 1, "is_fault should be high"
 
-        # Progress to VALIDATING (state 3)
-        dut.start.value = 1
-        await RisingEdge(dut.clk)
-        dut.start.value = 0
-        await ClockCycles(dut.clk, 12)  # Enough to reach VALIDATING
+    # Attempt to clear fault by removing inject signals (won't work - sticky)
+    set_inputs(dut, enable=1)
+    await fast_cycles(dut, 10)
 
-        voltage_normal = digital_to_voltage(int(dut.voltage_out.value.to_signed()))
-        dut._log.info(f"Phase 1 - Normal state: {voltage_normal:+.3f}V")
-        assert voltage_normal > 0, "Should be in normal state (positive)"
+    voltage_still_fault = read_voltage(vout)
+    dut._log.info(f"After waiting (no reset): {voltage_still_fault:+.3f}V")
+    assert dut.is_fault.value == 1, "Fault should be sticky (no clear without reset)"
 
-        # Cycle 2: Enter fault
-        dut.inject_fault.value = 1
-        await RisingEdge(dut.clk)
-        dut.inject_fault.value = 0
-        await ClockCycles(dut.clk, 2)
+    # Now reset to recover
+    await fast_reset(dut)
+    await ClockCycles(dut.clk, RESET_SETTLE_CYCLES)
 
-        voltage_fault = digital_to_voltage(int(dut.voltage_out.value.to_signed()))
-        dut._log.info(f"Phase 2 - Fault state: {voltage_fault:+.3f}V")
-        assert voltage_fault < 0, "Should be in fault state (negative)"
+    code_recovered = read_code(vout)
+    voltage_recovered = code_recovered * _INV_SCALE
+    dut._log.info(f"After reset: {voltage_recovered:+.3f}V")
+    assert code_near_state(code_recovered, 0), "Should recover to IDLE (0.0V)"
+    assert dut.is_fault.value == 0, "is_fault should clear after reset"
+    assert dut.is_idle.value == 1, "Should return to IDLE"
 
-        # Cycle 3: Reset and return to normal
-        await reset_active_low(dut, rst_signal="n_reset")
-        await ClockCycles(dut.clk, 2)
+    dut._log.info("✓ Edge case (fault recovery) test PASSED")
+    dut._log.info("Note: Faults are sticky - only reset clears them")
 
-        voltage_recovered = digital_to_voltage(int(dut.voltage_out.value.to_signed()))
-        dut._log.info(f"Phase 3 - Recovered: {voltage_recovered:+.3f}V")
-        assert abs(voltage_recovered) < 0.1, "Should recover to IDLE"
 
-        # Cycle 4: Progress again to verify normal operation restored
-        dut.start.value = 1
-        await RisingEdge(dut.clk)
-        dut.start.value = 0
-        await ClockCycles(dut.clk, 5)
+@cocotb.test(timeout_time=_TEST_TIMEOUT_NS, timeout_unit="ns")
+async def test_edge_case_normal_to_fault_to_normal(dut):
+    """Test 15: Edge Case - Full cycle: normal → fault → reset → normal"""
+    dut._log.info(_BANNER)
+    dut._log.info("Test 15: Edge Case - Complete Fault/Recovery Cycle")
+    dut._log.info(_BANNER)
 
-        voltage_final = digital_to_voltage(int(dut.voltage_out.value.to_signed()))
-        dut._log.info(f"Phase 4 - Normal operation: {voltage_final:+.3f}V")
-        assert voltage_final > 0.3, "Should progress normally after recovery"
+    # Cycle 1: Start in normal state
+    await setup_fsm(dut)
+    vout = dut.voltage_out
 
-        dut._log.info("✓ Edge case (full cycle) test PASSED")
-        dut._log.info("Note: FSM observer correctly tracks full lifecycle")
+    # Progress to VALIDATING (state 3)
+    await pulse(dut.start, dut.clk)
+    await fast_cycles(dut, 12)  # Enough to reach VALIDATING
 
-    await run_with_timeout(test_logic(), timeout_sec=10, test_name="test_edge_case_normal_to_fault_to_normal")
+    voltage_normal = read_voltage(vout)
+    dut._log.info(f"Phase 1 - Normal state: {voltage_normal:+.3f}V")
+    assert voltage_normal > 0, "Should be in normal state (positive)"
 
+    # Cycle 2: Enter fault
+    await enter_fault(dut, dut.inject_fault)
 
-@cocotb.test()
-async def test_edge_case_fsm_disabled(dut):
-    """Test 16: Edge Case - FSM disabled (enable=0) while observer active"""
-    async def test_logic():
-        dut._log.info("=" * 80)
-        dut._log.info("Test 16: Edge Case - FSM Disabled During Observation")
-        dut._log.info("=" * 80)
+    voltage_fault = read_voltage(vout)
+    dut._log.info(f"Phase 2 - Fault state: {voltage_fault:+.3f}V")
+    assert voltage_fault < 0, "Should be in fault state (negative)"
 
-        # Setup
-        await setup_clock(dut)
-        dut.enable.value = 1
-        dut.start.value = 0
-        dut.inject_error.value = 0
-        dut.inject_fault.value = 0
-        await reset_active_low(dut, rst_signal="n_reset")
-        await ClockCycles(dut.clk, 2)
+    # Cycle 3: Reset and return to normal
+    await fast_reset(dut)
+    await ClockCycles(dut.clk, RESET_SETTLE_CYCLES)
 
-        # Progress to REQUEST state
-        dut.start.value = 1
-        await RisingEdge(dut.clk)
-        dut.start.value = 0
-        await ClockCycles(dut.clk, 2)
+    code_recovered = read_code(vout)
+    voltage_recovered = code_recovered * _INV_SCALE
+    dut._log.info(f"Phase 3 - Recovered: {voltage_recovered:+.3f}V")
+    assert code_near_state(code_recovered, 0), "Should recover to IDLE"
 
-        voltage_enabled = digital_to_voltage(int(dut.voltage_out.value.to_signed()))
-        dut._log.info(f"FSM enabled, state progressing: {voltage_enabled:+.3f}V")
-        assert voltage_enabled > 0, "Should have progressed from IDLE"
+    # Cycle 4: Progress again to verify normal operation restored
+    await pulse(dut.start, dut.clk)
+    await fast_cycles(dut, 5)
 
-        # Disable FSM (state should freeze)
-        dut.enable.value = 0
-        await ClockCycles(dut.clk, 10)
+    voltage_final = read_voltage(vout)
+    dut._log.info(f"Phase 4 - Normal operation: {voltage_final:+.3f}V")
+    assert voltage_final > 0.3, "Should progress normally after recovery"
 
-        voltage_disabled = digital_to_voltage(int(dut.voltage_out.value.to_signed()))
-        dut._log.info(f"FSM disabled (frozen): {voltage_disabled:+.3f}V")
+    dut._log.info("✓ Edge case (full cycle) test PASSED")
+    dut._log.info("Note: FSM observer correctly tracks full lifecycle")
 
-        # Observer should continue to track whatever state FSM is in
-        # Voltage should remain stable (FSM frozen, observer tracking frozen state)
-        assert abs(voltage_disabled - voltage_enabled) < 0.1, \
-            "Observer should track frozen FSM state"
 
-        # Re-enable FSM
-        dut.enable.value = 1
-        await ClockCycles(dut.clk, 10)
+async def _edge_case_fsm_disabled(dut):
+    """Test 16: Edge Case - FSM disabled (enable=0) while observer active"""
+    dut._log.info(_BANNER)
+    dut._log.info("Test 16: Edge Case - FSM Disabled During Observation")
+    dut._log.info(_BANNER)
 
-        voltage_reenabled = digital_to_voltage(int(dut.voltage_out.value.to_signed()))
-        dut._log.info(f"FSM re-enabled, progressing: {voltage_reenabled:+.3f}V")
+    # Setup
+    await setup_fsm(dut, clock=False)
+    vout = dut.voltage_out
 
-        # Should have progressed further
-        assert voltage_reenabled >= voltage_disabled, \
-            "FSM should resume progression after re-enable"
+    # Progress to REQUEST state
+    await pulse(dut.start, dut.clk)
+    await ClockCycles(dut.clk, OBSERVER_SETTLE_CYCLES)
 
-        dut._log.info("✓ Edge case (FSM disabled) test PASSED")
-        dut._log.info("Note: Observer tracks FSM state regardless of enable")
+    voltage_enabled = read_voltage(vout)
+    dut._log.info(f"FSM enabled, state progressing: {voltage_enabled:+.3f}V")
+    assert voltage_enabled > 0, "Should have progressed from IDLE"
 
-    await run_with_timeout(test_logic(), timeout_sec=10, test_name="test_edge_case_fsm_disabled")
+    # Disable FSM (state should freeze)
+    dut.enable.value = 0
+    await fast_cycles(dut, 10)
 
+    voltage_disabled = read_voltage(vout)
+    dut._log.info(f"FSM disabled (frozen): {voltage_disabled:+.3f}V")
 
-@cocotb.test()
-async def test_edge_case_state_transition_timing(dut):
-    """Test 17: Edge Case - Observer tracks state transitions immediately"""
-    async def test_logic():
-        dut._log.info("=" * 80)
-        dut._log.info("Test 17: Edge Case - State Transition Timing")
-        dut._log.info("=" * 80)
+    # Observer should continue to track whatever state FSM is in
+    # Voltage should remain stable (FSM frozen, observer tracking frozen state)
+    assert abs(voltage_disabled - voltage_enabled) < 0.1, \
+        "Observer should track frozen FSM state"
 
-        # Setup
-        await setup_clock(dut)
-        dut.enable.value = 1
-        dut.start.value = 0
-        dut.inject_error.value = 0
-        dut.inject_fault.value = 0
-        await reset_active_low(dut, rst_signal="n_reset")
-        await ClockCycles(dut.clk, 2)
+    # Re-enable FSM
+    dut.enable.value = 1
+    await fast_cycles(dut, 10)
+
+    voltage_reenabled = read_voltage(vout)
+    dut._log.info(f"FSM re-enabled, progressing: {voltage_reenabled:+.3f}V")
 
-        # Track voltage through multiple state transitions
-        voltages = []
-        states = ["IDLE", "REQUEST", "LOADING"]
+    # Should have progressed further
+    assert voltage_reenabled >= voltage_disabled, \
+        "FSM should resume progression after re-enable"
 
-        # IDLE
-        voltage_idle = digital_to_voltage(int(dut.voltage_out.value.to_signed()))
-        voltages.append(voltage_idle)
-        dut._log.info(f"State 0 (IDLE): {voltage_idle:+.3f}V")
+    dut._log.info("✓ Edge case (FSM disabled) test PASSED")
+    dut._log.info("Note: Observer tracks FSM state regardless of enable")
 
-        # Trigger transition
-        dut.start.value = 1
-        await RisingEdge(dut.clk)
-        dut.start.value = 0
-        await RisingEdge(dut.clk)  # Now in REQUEST
 
-        voltage_request = digital_to_voltage(int(dut.voltage_out.value.to_signed()))
-        voltages.append(voltage_request)
-        dut._log.info(f"State 1 (REQUEST): {voltage_request:+.3f}V")
+async def _edge_case_state_transition_timing(dut):
+    """Test 17: Edge Case - Observer tracks state transitions immediately"""
+    dut._log.info(_BANNER)
+    dut._log.info("Test 17: Edge Case - State Transition Timing")
+    dut._log.info(_BANNER)
+
+    # Setup
+    await setup_fsm(dut, clock=False)
+    vout = dut.voltage_out
 
-        # Wait for transition to LOADING
-        await ClockCycles(dut.clk, 4)
+    # Track voltage through multiple state transitions
+    voltages = []
 
-        voltage_loading = digital_to_voltage(int(dut.voltage_out.value.to_signed()))
-        voltages.append(voltage_loading)
-        dut._log.info(f"State 2 (LOADING): {voltage_loading:+.3f}V")
+    # IDLE
+    voltage_idle = read_voltage(vout)
+    voltages.append(voltage_idle)
+    dut._log.info(f"State 0 (IDLE): {voltage_idle:+.3f}V")
 
-        # Verify monotonic increase (stairstep up)
-        assert voltages[1] > voltages[0], "REQUEST > IDLE"
-        assert voltages[2] > voltages[1], "LOADING > REQUEST"
+    # Trigger transition
+    await pulse(dut.start, dut.clk)
+    await RisingEdge(dut.clk)  # Now in REQUEST
 
-        # Verify proper spacing
-        expected_step = 0.5  # From calculate_expected_voltage
-        actual_step1 = voltages[1] - voltages[0]
-        actual_step2 = voltages[2] - voltages[1]
+    voltage_request = read_voltage(vout)
+    voltages.append(voltage_request)
+    dut._log.info(f"State 1 (REQUEST): {voltage_request:+.3f}V")
 
-        dut._log.info(f"Voltage steps: {actual_step1:.3f}V, {actual_step2:.3f}V")
-        assert abs(actual_step1 - expected_step) < 0.1, "Consistent voltage spacing"
-        assert abs(actual_step2 - expected_step) < 0.1, "Consistent voltage spacing"
+    # Wait for transition to LOADING
+    await fast_cycles(dut, 4)
 
-        dut._log.info("✓ Edge case (transition timing) test PASSED")
-        dut._log.info("Note: Observer updates immediately on state transitions")
+    voltage_loading = read_voltage(vout)
+    voltages.append(voltage_loading)
+    dut._log.info(f"State 2 (LOADING): {voltage_loading:+.3f}V")
 
-    await run_with_timeout(test_logic(), timeout_sec=10, test_name="test_edge_case_state_transition_timing")
+    # One check against the stairstep table covers both ordering and spacing
+    assert all(
+        math.isclose(v, expected, abs_tol=0.1)
+        for v, expected in zip(voltages, _EXPECTED_V[:3])
+    ), f"IDLE/REQUEST/LOADING {voltages} should match {_EXPECTED_V[:3]}"
 
+    dut._log.info("✓ Edge case (transition timing) test PASSED")
+    dut._log.info("Note: Observer updates immediately on state transitions")
 
-@cocotb.test()
+
+@cocotb.test(timeout_time=_TEST_TIMEOUT_NS, timeout_unit="ns")
 async def test_configuration_notes(dut):
     """Test 18: Configuration Edge Cases (Documentation Test)
 
@@ -892,150 +901,77 @@ async def test_configuration_notes(dut):
     These scenarios require different generic values and can't be tested
     with the current DUT, but should be understood:
     """
-    async def test_logic():
-        dut._log.info("=" * 80)
-        dut._log.info("Test 18: Configuration Edge Cases (Documentation)")
-        dut._log.info("=" * 80)
-
-        dut._log.info("Documenting untested configuration edge cases:")
-        dut._log.info("1. V_MIN > V_MAX (inverted voltage range):")
-        dut._log.info("   - Would produce DESCENDING stairstep (high→low)")
-        dut._log.info("   - Negative v_step in LUT calculation")
-        dut._log.info("   - Valid but unconventional (down = progress)")
-        dut._log.info("2. V_MIN = V_MAX (zero voltage range):")
-        dut._log.info("   - v_step = 0.0, all states at same voltage")
-        dut._log.info("   - Observer provides no state discrimination")
-        dut._log.info("   - Valid but useless configuration")
-        dut._log.info("3. FAULT_STATE_THRESHOLD = 0 (all states are faults):")
-        dut._log.info("   - num_normal = 0, LUT calculation special case")
-        dut._log.info("   - All voltages would be sign-flipped")
-        dut._log.info("   - Likely configuration error")
-        dut._log.info("4. FAULT_STATE_THRESHOLD = 1 (only IDLE is normal):")
-        dut._log.info("   - IDLE at V_MIN, all other states fault")
-        dut._log.info("   - Valid for 'anything but IDLE = fault' semantics")
-        dut._log.info("   - Useful for simple error detection")
-        dut._log.info("5. NUM_STATES = 1 (single-state FSM):")
-        dut._log.info("   - v_step calculation: (V_MAX-V_MIN)/0 → special case")
-        dut._log.info("   - VHDL handles: if num_normal > 1")
-        dut._log.info("   - State 0 maps to V_MIN")
-        dut._log.info("6. State vector > NUM_STATES (invalid state index):")
-        dut._log.info("   - Observer LUT has 64 entries (6-bit addressing)")
-        dut._log.info("   - States >= NUM_STATES map to MOKU_DIGITAL_ZERO")
-        dut._log.info("   - Failsafe: invalid states → 0.0V")
-        dut._log.info("7. Extreme voltage ranges (±5V limits):")
-        dut._log.info("   - Moku DAC range: -5V to +5V")
-        dut._log.info("   - voltage_to_digital() clamps to ±32768")
-        dut._log.info("   - Observer handles full range correctly")
-        dut._log.info("8. Negative voltage ranges (V_MIN=-2.5, V_MAX=-0.5):")
-        dut._log.info("   - Valid! Produces negative stairstep")
-        dut._log.info("   - Fault sign-flip makes voltage MORE negative")
-        dut._log.info("   - Unconventional but mathematically sound")
-        dut._log.info("✓ Configuration documentation test PASSED")
-        dut._log.info("Note: These scenarios warrant future test coverage")
-
-    await run_with_timeout(test_logic(), timeout_sec=5, test_name="test_configuration_notes")
-
-
-@cocotb.test()
-async def test_edge_case_rapid_state_changes(dut):
+    dut._log.info(_CONFIGURATION_NOTES)
+
+
+async def _edge_case_rapid_state_changes(dut):
     """Test 19: Edge Case - Rapid state changes and observer responsiveness"""
-    async def test_logic():
-        dut._log.info("=" * 80)
-        dut._log.info("Test 19: Edge Case - Rapid State Changes")
-        dut._log.info("=" * 80)
+    dut._log.info(_BANNER)
+    dut._log.info("Test 19: Edge Case - Rapid State Changes")
+    dut._log.info(_BANNER)
+
+    # Setup
+    await setup_fsm(dut, clock=False)
+    vout = dut.voltage_out
+
+    # Stress test: Progress through all states rapidly
+    await pulse(dut.start, dut.clk)
+
+    # Track voltage changes through rapid progression: sample every 5th of the
+    # next 25 cycles (should reach RUNNING in ~15), convert once at the end
+    await RisingEdge(dut.clk)
+    codes_seen = [read_code(vout)]
+    for _ in range(4):
+        await fast_cycles(dut, 5)
+        codes_seen.append(read_code(vout))
+    await fast_cycles(dut, 4)
+
+    voltages_seen = digitals_to_voltages(codes_seen)
+    for i, voltage in enumerate(voltages_seen):
+        dut._log.info(f"Cycle {5 * i:02d}: {voltage:+.3f}V")
+
+    # Verify we saw progression (voltage increased over time)
+    assert voltages_seen[-1] > voltages_seen[0], \
+        "Voltage should increase during normal progression"
+
+    # Now stress test: rapid fault injection and recovery cycles
+    clk, inject_error = dut.clk, dut.inject_error
+    for i in range(3):
+        # Inject fault
+        await pulse(inject_error, clk)
+        await RisingEdge(clk)
 
-        # Setup
-        await setup_clock(dut)
-        dut.enable.value = 1
-        dut.start.value = 0
-        dut.inject_error.value = 0
-        dut.inject_fault.value = 0
-        await reset_active_low(dut, rst_signal="n_reset")
-        await ClockCycles(dut.clk, 2)
-
-        # Stress test: Progress through all states rapidly
-        dut.start.value = 1
-        await RisingEdge(dut.clk)
-        dut.start.value = 0
-
-        # Track voltage changes through rapid progression
-        voltages_seen = []
-        for cycle in range(25):  # Should reach RUNNING in ~15 cycles
-            await RisingEdge(dut.clk)
-            voltage = digital_to_voltage(int(dut.voltage_out.value.to_signed()))
-            if cycle % 5 == 0:  # Sample every 5 cycles
-                voltages_seen.append(voltage)
-                dut._log.info(f"Cycle {cycle:02d}: {voltage:+.3f}V")
-
-        # Verify we saw progression (voltage increased over time)
-        assert voltages_seen[-1] > voltages_seen[0], \
-            "Voltage should increase during normal progression"
-
-        # Now stress test: rapid fault injection and recovery cycles
-        for i in range(3):
-            # Inject fault
-            dut.inject_error.value = 1
-            await RisingEdge(dut.clk)
-            dut.inject_error.value = 0
-            await RisingEdge(dut.clk)
-
-            voltage_fault = digital_to_voltage(int(dut.voltage_out.value.to_signed()))
-            dut._log.info(f"Rapid fault cycle {i+1}: {voltage_fault:+.3f}V")
-            assert voltage_fault < 0, f"Fault cycle {i+1} should be negative"
-
-            # Reset
-            await reset_active_low(dut, rst_signal="n_reset")
-            await RisingEdge(dut.clk)
-
-            voltage_reset = digital_to_voltage(int(dut.voltage_out.value.to_signed()))
-            assert abs(voltage_reset) < 0.1, f"Reset cycle {i+1} should return to IDLE"
-
-        dut._log.info("✓ Edge case (rapid state changes) test PASSED")
-        dut._log.info("Note: Observer handles rapid transitions and fault/reset cycles")
-
-    await run_with_timeout(test_logic(), timeout_sec=15, test_name="test_edge_case_rapid_state_changes")
-
-
-@cocotb.test()
+        voltage_fault = read_voltage(vout)
+        dut._log.info(f"Rapid fault cycle {i+1}: {voltage_fault:+.3f}V")
+        assert voltage_fault < 0, f"Fault cycle {i+1} should be negative"
+
+        # Reset, then sample one edge later
+        await fast_reset(dut)
+        await ClockCycles(clk, RESET_SETTLE_CYCLES)
+
+        code_reset = read_code(vout)
+        assert code_near_state(code_reset, 0), f"Reset cycle {i+1} should return to IDLE"
+
+    dut._log.info("✓ Edge case (rapid state changes) test PASSED")
+    dut._log.info("Note: Observer handles rapid transitions and fault/reset cycles")
+
+
+@cocotb.test(timeout_time=_TEST_TIMEOUT_NS, timeout_unit="ns")
+async def test_edge_cases_bundle(dut):
+    """Tests 16, 17, 19: FSM disabled, transition timing, rapid state changes
+
+    Run as scenarios of one cocotb test on one clock, each from a fresh reset.
+    """
+    await setup_clock(dut)
+    await _edge_case_fsm_disabled(dut)
+    await _edge_case_state_transition_timing(dut)
+    await _edge_case_rapid_state_changes(dut)
+
+
+@cocotb.test(timeout_time=_TEST_TIMEOUT_NS, timeout_unit="ns")
 async def test_summary(dut):
-    """Test 20: Comprehensive Test Summary"""
-    async def test_logic():
-        dut._log.info("=" * 80)
-        dut._log.info("FSM Observer Pattern - Comprehensive Test Summary")
-        dut._log.info("=" * 80)
-        dut._log.info("✅ ALL TESTS PASSED")
-        dut._log.info("Core Functionality (Tests 1-8):")
-        dut._log.info("  ✓ Reset behavior and initialization")
-        dut._log.info("  ✓ Normal state progression (voltage stairstep)")
-        dut._log.info("  ✓ Sign-flip fault indication from multiple states")
-        dut._log.info("  ✓ Automatic voltage spreading (0.0V → 2.5V)")
-        dut._log.info("  ✓ Fault states are sticky (reset required)")
-        dut._log.info("Edge Case Coverage (Tests 9-19):")
-        dut._log.info("  ✓ Sign-flip from 0.0V state (IDLE)")
-        dut._log.info("  ✓ Sign-flip from V_MAX state (RUNNING = 2.5V)")
-        dut._log.info("  ✓ Rapid fault entry after reset")
-        dut._log.info("  ✓ Multiple consecutive fault transitions")
-        dut._log.info("  ✓ FAULT_STATE_THRESHOLD boundary behavior")
-        dut._log.info("  ✓ Fault recovery via reset")
-        dut._log.info("  ✓ Complete fault/recovery lifecycle")
-        dut._log.info("  ✓ FSM disabled (enable=0) during observation")
-        dut._log.info("  ✓ State transition timing and spacing")
-        dut._log.info("  ✓ Rapid state changes and stress testing")
-        dut._log.info("Configuration Documentation (Test 18):")
-        dut._log.info("  ✓ Inverted voltage ranges (V_MIN > V_MAX)")
-        dut._log.info("  ✓ Zero voltage range (V_MIN = V_MAX)")
-        dut._log.info("  ✓ Extreme fault thresholds (0, 1, NUM_STATES)")
-        dut._log.info("  ✓ Invalid state indices handling")
-        dut._log.info("  ✓ Voltage range limits (±5V)")
-        dut._log.info("  ✓ Negative voltage range configurations")
-        dut._log.info("Key Design Validations:")
-        dut._log.info("  ✓ Observer is non-invasive (FSM unchanged)")
-        dut._log.info("  ✓ prev_voltage register updates only in normal states")
-        dut._log.info("  ✓ Sign-flip preserves debugging context (magnitude)")
-        dut._log.info("  ✓ LUT failsafe (invalid states → 0.0V)")
-        dut._log.info("  ✓ Single-cycle state transition tracking")
-        dut._log.info("=" * 80)
-        dut._log.info("Pattern validated and ready for production deployment!")
-        dut._log.info("=" * 80)
-
-    await run_with_timeout(test_logic(), timeout_sec=5, test_name="test_summary")
+    """Test 20: Comprehensive Test Summary
+
+    No test here inspects waveforms; tests/run.py only dumps them with WAVES=1.
+    """
+    dut._log.info(_SUMMARY)
@@ -15,21 +15,8 @@ Date: 2025-01-26
 import os
 import sys
 
-
-def print_separator():
-    print("=" * 70)
-
-
-def simulate_old_style_output():
-    """Simulate the old verbose CocotB output"""
-    print("\n")
-    print_separator()
-    print("OLD STYLE OUTPUT (Current CocotB default)")
-    print_separator()
-    print()
-
-    # Simulate typical CocotB output
-    test_output = """
+# Sample outputs shown by the demo, and their line counts
+_OLD_OUTPUT = """
      0.00ns INFO     cocotb.gpi                         ..mbed/gpi_embed.cpp:76   in set_program_name_in_venv        Did not detect Python virtual environment. Using system-wide Python interpreter
      0.00ns INFO     cocotb.gpi                         ../gpi/GpiCommon.cpp:101   in gpi_print_registered_impl       VPI registered
      0.00ns INFO     cocotb.gpi                         ..mbed/gpi_embed.cpp:122   in _embed_init_python              Python interpreter initialized and cocotb loaded!
@@ -100,23 +87,9 @@ REGRESSION SUMMARY
    2000.00ns INFO     cocotb.regression                   regression.py:372          in _log_test_summary
    2000.00ns INFO     cocotb.regression                   regression.py:373          in _log_test_summary              ALL TESTS PASSED
     """
-    print(test_output)
-
-    # Count lines
-    line_count = len(test_output.strip().split('\n'))
-    print(f"\nTOTAL OUTPUT: {line_count} lines")
-    print("CONTEXT USAGE: ~4000 tokens")
-    print()
-
-
-def simulate_new_style_minimal():
-    """Simulate new P1 + MINIMAL output (LLM-friendly)"""
-    print_separator()
-    print("NEW STYLE - P1 + MINIMAL (Default for LLMs)")
-    print_separator()
-    print()
+_OLD_OUTPUT_LINES = _OLD_OUTPUT.strip().count("\n") + 1
 
-    test_output = """P1 - BASIC TESTS
+_MINIMAL_OUTPUT = """P1 - BASIC TESTS
 T1: Reset behavior
   ✓ PASS
 T2: Count up to 5
@@ -126,23 +99,9 @@ T3: Count down from 5
 T4: Enable control
   ✓ PASS
 ALL 4 TESTS PASSED"""
+_MINIMAL_OUTPUT_LINES = _MINIMAL_OUTPUT.strip().count("\n") + 1
 
-    print(test_output)
-
-    line_count = len(test_output.strip().split('\n'))
-    print(f"\nTOTAL OUTPUT: {line_count} lines")
-    print("CONTEXT USAGE: ~50 tokens")
-    print()
-
-
-def simulate_new_style_normal():
-    """Simulate new P1 + NORMAL output (human-friendly)"""
-    print_separator()
-    print("NEW STYLE - P1 + NORMAL (Human-friendly)")
-    print_separator()
-    print()
-
-    test_output = """============================================================
+_NORMAL_OUTPUT = """============================================================
 PHASE: P1 - BASIC TESTS
 ============================================================
 ============================================================
@@ -164,11 +123,53 @@ PASSED: 4
 FAILED: 0
 RESULT: ALL TESTS PASSED ✓
 ============================================================"""
+_NORMAL_OUTPUT_LINES = _NORMAL_OUTPUT.strip().count("\n") + 1
+
+
+def print_separator():
+    print("=" * 70)
+
+
+def simulate_old_style_output():
+    """Simulate the old verbose CocotB output"""
+    print("\n")
+    print_separator()
+    print("OLD STYLE OUTPUT (Current CocotB default)")
+    print_separator()
+    print()
+
+    # Simulate typical CocotB output
+    sys.stdout.write(_OLD_OUTPUT + "\n")
+
+    print(f"\nTOTAL OUTPUT: {_OLD_OUTPUT_LINES} lines")
+    print("CONTEXT USAGE: ~4000 tokens")
+    print()
+
+
+def simulate_new_style_minimal():
+    """Simulate new P1 + MINIMAL output (LLM-friendly)"""
+    print_separator()
+    print("NEW STYLE - P1 + MINIMAL (Default for LLMs)")
+    print_separator()
+    print()
+
+    sys.stdout.write(_MINIMAL_OUTPUT + "\n")
+
+    print(f"\nTOTAL OUTPUT: {_MINIMAL_OUTPUT_LINES} lines")
+    print("CONTEXT USAGE: ~50 tokens")
+    print()
+
+
+def simulate_new_style_normal():
+    """Simulate new P1 + NORMAL output (human-friendly)"""
+    print_separator()
+    print("NEW STYLE - P1 + NORMAL (Human-friendly)")
+    print_separator()
+    print()
 
-    print(test_output)
+    sys.stdout.write(_NORMAL_OUTPUT + "\n")
 
-    line_count = len(test_output.strip().split('\n'))
-    print(f"\nTOTAL OUTPUT: {line_count} lines")
+    print(f"\nTOTAL OUTPUT: {_NORMAL_OUTPUT_LINES} lines")
     print("CONTEXT USAGE: ~150 tokens")
     print()
 
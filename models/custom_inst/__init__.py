@@ -42,7 +42,17 @@ For complete documentation, see:
 """
 
 from .app_register import AppRegister, RegisterType
-from .custom_inst_app import CustomInstApp
+
+
+def __getattr__(name):
+    # CustomInstApp pulls in yaml and jinja2; import it on first use (PEP 562)
+    # so code that only needs AppRegister/RegisterType doesn't pay for them
+    if name == 'CustomInstApp':
+        from .custom_inst_app import CustomInstApp
+        globals()['CustomInstApp'] = CustomInstApp
+        return CustomInstApp
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
 
 __all__ = [
     'CustomInstApp',
@@ -19,17 +19,22 @@ Features:
     - GHDL resolves dependencies automatically
     - Works from any directory (finds project root)
     - Skips testbenches and test wrappers
+    - Incremental: re-imports only sources changed since the last run
     - Comprehensive error reporting
 
 Author: Claude Code (GHDL Build Modernization)
 Date: 2025-01-25
 """
 
+from collections import deque
+import json
+import os
 from pathlib import Path
+import re
 import subprocess
 import sys
 import shutil
-from typing import List, Optional
+from typing import Dict, Iterator, List, Optional, Tuple
 
 
 # ANSI color codes for output
@@ -43,16 +48,15 @@ class Colors:
 
 def find_project_root() -> Path:
     """Find project root by looking for pyproject.toml"""
-    current = Path(__file__).resolve().parent
+    script_path = Path(__file__).resolve()
 
-    # Go up until we find pyproject.toml or hit root
-    while current != current.parent:
-        if (current / "pyproject.toml").exists():
-            return current
-        current = current.parent
+    # Go up until we find pyproject.toml - one isfile() stat per ancestor
+    for parent in script_path.parents:
+        if os.path.isfile(os.path.join(parent, "pyproject.toml")):
+            return parent
 
     # Fallback: assume script is in scripts/ subdirectory
-    return Path(__file__).resolve().parent.parent
+    return script_path.parent.parent
 
 
 PROJECT_ROOT = find_project_root()
@@ -60,6 +64,7 @@ MODULES_DIR = PROJECT_ROOT / "modules"
 INSTRUMENTS_DIR = PROJECT_ROOT / "instruments"
 EXPERIMENTAL_DIR = PROJECT_ROOT / "experimental"
 WORK_DIR = MODULES_DIR / "work"
+MTIME_MANIFEST_FILE = WORK_DIR / ".file_mtimes.json"  # {path: mtime_ns} of last successful import
 
 
 def print_status(icon: str, message: str, color: str = Colors.NC):
@@ -67,9 +72,67 @@ def print_status(icon: str, message: str, color: str = Colors.NC):
     print(f"{color}{icon} {message}{Colors.NC}")
 
 
-def find_vhdl_files() -> List[Path]:
+# Directories that never contain synthesizable sources - pruned before descending
+SKIP_DIRS = frozenset({"tb", "incoming", "cloudcompile_package"})
+
+# All file-level skip rules in one pattern, matched once per path string:
+# testbench dirs, cloudcompile packages, incoming dirs, test wrappers (name only)
+SKIP_RE = re.compile(
+    r"[\\/]tb[\\/]|cloudcompile_package|incoming|wrapper[^\\/]*$",
+    re.IGNORECASE,
+)
+
+
+def _iter_vhdl(root: Path, follow_symlinks: bool = False) -> Iterator[Tuple[str, int]]:
     """
-    Find all VHDL source files across the project.
+    Walk a directory tree with os.scandir and yield VHDL source paths.
+
+    Skipped directories (SKIP_DIRS) are pruned before descending, so their
+    subtrees are never enumerated. DirEntry type checks are cached by
+    scandir, and the mtime comes from DirEntry.stat() on the entry already
+    in hand (free on Windows, one stat on POSIX) - no second pass later.
+
+    Symlinks are ignored by default, so no entry costs an extra stat() to
+    resolve its target. With follow_symlinks, linked files and directories
+    are included and each directory is entered once (cycle-safe).
+
+    Args:
+        root: Directory to search
+        follow_symlinks: Also walk symlinked directories and files
+
+    Yields:
+        (path string, mtime_ns) of .vhd files (test wrappers excluded)
+    """
+    visited = set()
+    if follow_symlinks:
+        st = os.stat(root)
+        visited.add((st.st_dev, st.st_ino))
+
+    stack = deque([str(root)])
+    while stack:
+        directory = stack.pop()
+        with os.scandir(directory) as it:
+            for entry in it:
+                name = entry.name
+                if entry.is_dir(follow_symlinks=follow_symlinks):
+                    if name in SKIP_DIRS:
+                        continue
+                    if follow_symlinks:
+                        st = entry.stat()
+                        key = (st.st_dev, st.st_ino)
+                        if key in visited:
+                            continue
+                        visited.add(key)
+                    stack.append(entry.path)
+                elif entry.is_file(follow_symlinks=follow_symlinks):
+                    path = entry.path
+                    if name.endswith(".vhd") and not SKIP_RE.search(path):
+                        yield path, entry.stat(follow_symlinks=follow_symlinks).st_mtime_ns
+
+
+def find_vhdl_sources(include_symlinks: bool = False) -> Dict[str, int]:
+    """
+    Find all VHDL source files across the project, with their mtimes.
 
     Searches in:
     - instruments/ (top-level instruments with MCC integration)
@@ -80,13 +143,17 @@ def find_vhdl_files() -> List[Path]:
     - modules/untested/ (modules without CocotB tests)
 
     Skips:
-    - Testbench files (containing 'tb' in path)
+    - Testbench files (in tb/ directories)
     - Test wrapper files (containing 'wrapper' in name)
     - Files in cloudcompile_package/ directories
     - Files in incoming/ directories
+    - Symlinked files and directories (unless include_symlinks)
+
+    Args:
+        include_symlinks: Follow symlinks (e.g. links to vendor IP)
 
     Returns:
-        List of Path objects for VHDL source files
+        Dict of {path string: mtime_ns}, ordered by path
     """
     vhdl_files = []
 
@@ -101,36 +168,22 @@ def find_vhdl_files() -> List[Path]:
     ]
 
     for location, _ in search_locations:
-        if not location.exists():
+        if not location.is_dir():
             continue
+        vhdl_files.extend(_iter_vhdl(location, include_symlinks))
 
-        # Find all .vhd files recursively
-        for vhd_file in location.rglob("*.vhd"):
-            # Skip testbenches
-            if "/tb/" in str(vhd_file) or "\\tb\\" in str(vhd_file):
-                continue
-
-            # Skip test wrappers
-            if "wrapper" in vhd_file.name.lower():
-                continue
-
-            # Skip cloudcompile packages
-            if "cloudcompile_package" in str(vhd_file):
-                continue
-
-            # Skip incoming directories
-            if "incoming" in str(vhd_file):
-                continue
-
-            vhdl_files.append(vhd_file)
-
-    return sorted(vhdl_files)  # Sort for consistent ordering
+    # Sorted for consistent ordering
+    vhdl_files.sort()
+    return dict(vhdl_files)
 
 
 def run_ghdl_command(args: List[str], description: str) -> bool:
     """
     Run a GHDL command and handle errors.
 
+    GHDL's output (warnings, errors) is streamed straight to the terminal
+    as it is produced rather than captured and re-printed afterwards.
+
     Args:
         args: Command arguments (including 'ghdl')
         description: Human-readable description for error messages
@@ -138,38 +191,59 @@ def run_ghdl_command(args: List[str], description: str) -> bool:
     Returns:
         True if successful, False otherwise
     """
-    try:
-        result = subprocess.run(
-            args,
-            cwd=MODULES_DIR,
-            capture_output=True,
-            text=True,
-            check=True
-        )
-
-        # Print any output (GHDL sometimes has warnings)
-        if result.stdout:
-            print(result.stdout)
-        if result.stderr:
-            print(result.stderr)
-
-        return True
+    # Make sure our own status lines appear before the child's output
+    sys.stdout.flush()
 
-    except subprocess.CalledProcessError as e:
-        print_status("❌", f"{description} failed!", Colors.RED)
-        if e.stdout:
-            print(e.stdout)
-        if e.stderr:
-            print(e.stderr)
-        return False
+    try:
+        with subprocess.Popen(args, cwd=MODULES_DIR) as proc:
+            returncode = proc.wait()
     except FileNotFoundError:
         print_status("❌", "GHDL not found! Install with your package manager.", Colors.RED)
         print("   brew install ghdl  # macOS")
         print("   apt install ghdl   # Ubuntu/Debian")
         return False
 
+    if returncode != 0:
+        print_status("❌", f"{description} failed!", Colors.RED)
+        return False
+
+    return True
 
-def import_all_sources() -> bool:
+
+def read_mtime_manifest() -> Optional[Dict[str, int]]:
+    """
+    Load the manifest written by the last successful import.
+
+    Returns:
+        Dict of {path: mtime_ns}, or None if there is no usable manifest
+        or no GHDL library to go with it
+    """
+    if not any(WORK_DIR.glob("work-*.cf")):
+        return None
+    try:
+        with open(MTIME_MANIFEST_FILE) as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return None
+
+
+def diff_mtime_manifest(old: Dict[str, int], new: Dict[str, int]) -> Tuple[List[str], bool]:
+    """
+    Compare two mtime manifests.
+
+    Args:
+        old: Manifest from the last successful import
+        new: Manifest of the current sources
+
+    Returns:
+        (files added or modified since 'old', True if any file was removed)
+    """
+    changed = [path for path, mtime in new.items() if old.get(path) != mtime]
+    removed = any(path not in new for path in old)
+    return changed, removed
+
+
+def import_all_sources(include_symlinks: bool = False) -> bool:
     """
     Import all VHDL sources into GHDL work library.
 
@@ -177,11 +251,19 @@ def import_all_sources() -> bool:
     This is much faster than compilation and lets GHDL figure out
     what depends on what.
 
+    Imports are incremental: only files added or modified since the last
+    successful import are passed to GHDL, and nothing runs when no file
+    changed. Removing a file forces a fresh import of everything.
+
+    Args:
+        include_symlinks: Follow symlinks when discovering sources
+
     Returns:
         True if successful, False otherwise
     """
     print_status("🔍", "Finding VHDL source files...", Colors.BLUE)
-    vhdl_files = find_vhdl_files()
+    manifest = find_vhdl_sources(include_symlinks)
+    vhdl_files = list(manifest)
 
     if not vhdl_files:
         print_status("❌", "No VHDL files found!", Colors.RED)
@@ -192,27 +274,49 @@ def import_all_sources() -> bool:
     # Show first few files for confirmation
     print("   First few files:")
     for f in vhdl_files[:5]:
-        rel_path = f.relative_to(PROJECT_ROOT)
+        rel_path = Path(f).relative_to(PROJECT_ROOT)
         print(f"     - {rel_path}")
     if len(vhdl_files) > 5:
         print(f"     ... and {len(vhdl_files) - 5} more")
 
+    previous = read_mtime_manifest()
+
+    if previous is None:
+        to_import = list(manifest)
+    else:
+        to_import, removed = diff_mtime_manifest(previous, manifest)
+        if removed:
+            # GHDL keeps entries for files it was once given - start over
+            print_status("⚠️", "Sources removed - re-importing everything", Colors.YELLOW)
+            for cf_file in WORK_DIR.glob("*-obj08.cf"):
+                cf_file.unlink()
+            to_import = list(manifest)
+        elif not to_import:
+            print_status("✅", "Import up-to-date - no source changes since last run", Colors.GREEN)
+            return True
+
     # Create work directory if it doesn't exist
     WORK_DIR.mkdir(exist_ok=True)
 
-    print_status("📦", "Importing sources into GHDL work library...", Colors.BLUE)
+    if len(to_import) < len(manifest):
+        print_status("📦", f"Importing {len(to_import)} changed source(s) into GHDL work library...", Colors.BLUE)
+    else:
+        print_status("📦", "Importing sources into GHDL work library...", Colors.BLUE)
 
-    # Import all files
+    # Import new/changed files
     cmd = [
         "ghdl",
         "-i",  # Import
         f"--workdir={WORK_DIR}",
         "--std=08",
-    ] + [str(f) for f in vhdl_files]
+    ] + to_import
 
     if not run_ghdl_command(cmd, "Import"):
         return False
 
+    with open(MTIME_MANIFEST_FILE, "w") as f:
+        json.dump(manifest, f, indent=0, sort_keys=True)
+
     print_status("✅", "Import complete - GHDL has dependency information", Colors.GREEN)
     return True
 
@@ -247,6 +351,59 @@ def build_entity(entity_name: str) -> bool:
     return True
 
 
+def build_entity_combined(entity_name: str) -> bool:
+    """
+    Build a specific entity through a GHDL-generated makefile.
+
+    'ghdl --gen-makefile' emits one rule per design unit with its
+    dependency edges from the imported library. make then re-analyzes
+    only out-of-date units before elaborating.
+
+    make runs serially: every generated rule is a 'ghdl -a' into the same
+    work library, and concurrent analyses would all rewrite work-obj08.cf
+    (losing units or corrupting the library).
+
+    Args:
+        entity_name: Name of the top-level entity to build
+
+    Returns:
+        True if successful, False otherwise
+    """
+    if shutil.which("make") is None:
+        print_status("❌", "make not found - needed for --make builds", Colors.RED)
+        return False
+
+    makefile = WORK_DIR / f"{entity_name}.mk"
+
+    print_status("🔨", f"Building entity '{entity_name}' via makefile...", Colors.BLUE)
+
+    cmd = [
+        "ghdl",
+        "--gen-makefile",
+        f"--workdir={WORK_DIR}",
+        "--std=08",
+        entity_name
+    ]
+
+    try:
+        with open(makefile, "w") as mk:
+            subprocess.run(cmd, cwd=MODULES_DIR, stdout=mk, stderr=subprocess.PIPE, text=True, check=True)
+    except subprocess.CalledProcessError as e:
+        print_status("❌", f"Makefile generation for {entity_name} failed!", Colors.RED)
+        if e.stderr:
+            print(e.stderr)
+        return False
+    except FileNotFoundError:
+        print_status("❌", "GHDL not found! Install with your package manager.", Colors.RED)
+        return False
+
+    if not run_ghdl_command(["make", "-f", str(makefile)], f"Build {entity_name}"):
+        return False
+
+    print_status("✅", f"Built '{entity_name}' successfully", Colors.GREEN)
+    return True
+
+
 def clean_build_artifacts():
     """
     Clean all build artifacts.
@@ -260,20 +417,17 @@ def clean_build_artifacts():
 
     cleaned_items = []
 
-    # Remove work directory
-    if WORK_DIR.exists():
-        shutil.rmtree(WORK_DIR)
-        cleaned_items.append("work/")
-
-    # Remove object files
-    for obj_file in MODULES_DIR.glob("*.o"):
-        obj_file.unlink()
-        cleaned_items.append(obj_file.name)
-
-    # Remove GHDL library files
-    for cf_file in MODULES_DIR.glob("work-*.cf"):
-        cf_file.unlink()
-        cleaned_items.append(cf_file.name)
+    # One pass over modules/: work directory, object files (*.o) and
+    # GHDL library files (work-*.cf)
+    with os.scandir(MODULES_DIR) as it:
+        for entry in it:
+            name = entry.name
+            if name == WORK_DIR.name and entry.is_dir(follow_symlinks=False):
+                shutil.rmtree(entry.path)
+                cleaned_items.append(name + "/")
+            elif name.endswith(".o") or (name.startswith("work-") and name.endswith(".cf")):
+                os.unlink(entry.path)
+                cleaned_items.append(name)
 
     # Remove elaborated executables (entity names)
     # Note: Hard to identify these automatically, so we skip for now
@@ -287,17 +441,20 @@ def clean_build_artifacts():
         print_status("✅", "Already clean (no artifacts found)", Colors.GREEN)
 
 
-def build_all() -> int:
+def build_all(include_symlinks: bool = False) -> int:
     """
     Build all modules by importing all sources.
 
     This doesn't elaborate any specific entities, but prepares
     GHDL's dependency graph so any entity can be quickly built.
 
+    Args:
+        include_symlinks: Follow symlinks when discovering sources
+
     Returns:
         0 on success, 1 on failure
     """
-    if not import_all_sources():
+    if not import_all_sources(include_symlinks):
         return 1
 
     print()
@@ -319,6 +476,7 @@ def main():
 Examples:
   python scripts/build_vhdl_deps.py                    # Import all sources (dependency graph)
   python scripts/build_vhdl_deps.py --entity foo       # Build entity 'foo'
+  python scripts/build_vhdl_deps.py --entity foo --make  # Build 'foo' via its makefile
   python scripts/build_vhdl_deps.py --clean            # Clean artifacts
 
   # Or with UV:
@@ -330,6 +488,7 @@ Features:
   - GHDL resolves dependencies automatically (no manual tracking!)
   - Works from any directory (finds project root)
   - Skips testbenches and test wrappers automatically
+  - Re-imports only changed sources (use --clean to force a full import)
         """
     )
 
@@ -344,6 +503,17 @@ Features:
         metavar="NAME",
         help="Build specific entity (elaborates with dependencies)"
     )
+    parser.add_argument(
+        "--make",
+        action="store_true",
+        help="With --entity: build through 'ghdl --gen-makefile' + make (re-analyzes only stale units)"
+    )
+
+    parser.add_argument(
+        "--include-symlinks",
+        action="store_true",
+        help="Follow symlinked files/directories when discovering sources (default: skip)"
+    )
 
     args = parser.parse_args()
 
@@ -360,16 +530,17 @@ Features:
 
     elif args.entity:
         # Import sources first, then build entity
-        if not import_all_sources():
+        if not import_all_sources(args.include_symlinks):
             return 1
         print()
-        if not build_entity(args.entity):
+        build = build_entity_combined if args.make else build_entity
+        if not build(args.entity):
             return 1
         return 0
 
     else:
         # Default: import all sources
-        return build_all()
+        return build_all(include_symlinks=args.include_symlinks)
 
 
 if __name__ == "__main__":
@@ -12,12 +12,15 @@ Author: VOLO Team
 Date: 2025-01-27
 """
 
+import functools
+
 import cocotb
-from cocotb.triggers import RisingEdge, ClockCycles
+from cocotb.triggers import RisingEdge, ClockCycles, First, Timer, ValueChange
 from conftest import (
     setup_clock, reset_active_high, init_mcc_inputs,
-    mcc_set_regs, mcc_cr0, run_with_timeout
+    mcc_set_regs, mcc_set_regs_seq, mcc_cr0
 )
+from ds1120_pd_tests.ds1120_pd_constants import PACKED_TRIGGER_HIGH, PACKED_TRIGGER_OVER
 
 # Test configuration
 CLK_PERIOD_NS = 8  # 125 MHz
@@ -38,310 +41,289 @@ VOLTAGE_2V4 = 0x3DCF
 VOLTAGE_3V0 = 0x4CCD
 
 
-def get_fsm_state(dut):
-    """Extract FSM state from internal signals"""
-    try:
-        # Access the FSM instance through hierarchy
-        fsm = dut.U_MCC_TOP.APP_INST.U_FSM
-        return fsm.current_state.value.integer
-    except:
-        # Fallback if hierarchy is different
-        return 0
+async def wait_for_change(signal, max_cycles):
+    """Wait until signal changes, or at most max_cycles clock periods
 
+    Wakes Python once on the event instead of once per cycle of a fixed wait.
+    """
+    await First(ValueChange(signal), Timer(max_cycles * CLK_PERIOD_NS, units="ns"))
 
-@cocotb.test()
-async def test_reset_behavior(dut):
-    """Test 1: Verify reset puts FSM in READY state"""
-    dut._log.info("=" * 70)
-    dut._log.info("Test 1: Reset Behavior")
-    dut._log.info("=" * 70)
 
-    async def test_logic():
-        # Setup
-        await setup_clock(dut, clk_signal="Clk")
-        await init_mcc_inputs(dut)
+# Set once a pin-level reset has run in this simulation; later tests only
+# clear the FSM through its RESET_FSM register (CR22)
+_pin_reset_done = False
 
-        # Apply reset
-        dut.Reset.value = 1
-        await ClockCycles(dut.Clk, 5)
 
-        # Check outputs are zero during reset
-        assert dut.OutputA.value == 0, "OutputA should be 0 during reset"
-        
-        # Release reset
-        dut.Reset.value = 0
-        await ClockCycles(dut.Clk, 2)
+async def setup_test(dut):
+    """Shared test setup: clock, idle MCC inputs, then reset
 
-        # Outputs should remain zero (no enable)
-        assert dut.OutputA.value == 0, "OutputA should be 0 after reset"
+    The first test of a run pulses the Reset pin; later ones pulse CR22, which
+    returns the FSM to READY from DONE/TIMEDOUT/HARDFAULT. If a previous test
+    left the FSM in ARMED/FIRING/COOLING, CR22 is ignored, OutputB (the FSM
+    observer) is not at READY's 0 V, and the Reset pin is pulsed instead.
+    """
+    global _pin_reset_done
+    await setup_clock(dut, clk_signal="Clk")
+    if _pin_reset_done:
+        await init_mcc_inputs(dut)
+        await mcc_set_regs_seq(dut, [({22: 1}, 2), ({22: 0}, 2)],
+                               simulate_network_delay=False)
+        if dut.OutputB.value.to_signed() != 0:
+            await reset_active_high(dut, rst_signal="Reset")
+    else:
+        await reset_active_high(dut, rst_signal="Reset")
+        await init_mcc_inputs(dut)
+        _pin_reset_done = True
 
-        dut._log.info("✓ Reset test PASSED")
 
-    await run_with_timeout(test_logic(), timeout_sec=5, test_name="test_reset_behavior")
+@functools.lru_cache(maxsize=None)
+def _fsm_state_handle(dut):
+    """Resolve the FSM state register once per DUT (one hierarchy walk)"""
+    return dut.U_MCC_TOP.APP_INST.U_FSM.current_state
 
 
-@cocotb.test()
-async def test_arm_and_trigger(dut):
-    """Test 2: Arm FSM and trigger probe"""
-    dut._log.info("=" * 70)
-    dut._log.info("Test 2: Arm and Trigger Sequence")
-    dut._log.info("=" * 70)
+def get_fsm_state(dut):
+    """Extract FSM state from internal signals
 
-    async def test_logic():
-        # Setup
-        await setup_clock(dut, clk_signal="Clk")
-        await reset_active_high(dut, rst_signal="Reset")
-        await init_mcc_inputs(dut)
+    A missing hierarchy raises instead of reading as STATE_READY.
+    """
+    return _fsm_state_handle(dut).value.to_unsigned()
+
+
+@cocotb.test(timeout_time=5, timeout_unit="sec")
+async def test_reset_behavior(dut):
+    """Test 1: Verify reset puts FSM in READY state"""
+    global _pin_reset_done
+    dut._log.info("--- Test 1: Reset Behavior ---")
 
-        # Configure registers
-        await mcc_set_regs(dut, {
-            0: mcc_cr0(),           # Enable with all 3 control bits
-            20: 1,                  # Armed
-            23: 0x00,              # No clock division
-            24: 0xFF,              # Delay lower
-            25: 10,                # Firing duration
-            26: 8,                 # Cooling duration
-            27: 0x3D,              # Trigger threshold high (2.4V)
-            28: 0xCF,              # Trigger threshold low
-            29: 0x30,              # Intensity high
-            30: 0x00               # Intensity low
-        }, set_mcc_ready=True)
+    # Setup
+    await setup_clock(dut, clk_signal="Clk")
+    await init_mcc_inputs(dut)
 
-        # Allow FSM to process arm command
-        await ClockCycles(dut.Clk, 5)
+    # Apply reset
+    dut.Reset.value = 1
+    await ClockCycles(dut.Clk, 5)
 
-        # Apply trigger signal above threshold
-        trigger_value = 0x4000  # > 2.4V
-        dut.InputA.value = trigger_value | (trigger_value << 16)
-        await ClockCycles(dut.Clk, 10)
+    # Check outputs are zero during reset
+    assert dut.OutputA.value == 0, "OutputA should be 0 during reset"
+    
+    # Release reset
+    dut.Reset.value = 0
+    await ClockCycles(dut.Clk, 2)
+    _pin_reset_done = True
 
-        # Check that output becomes active (trigger output should be non-zero)
-        # Note: Can't access internal FSM state in MCC wrapper easily
-        dut._log.info("✓ Arm and trigger test PASSED")
+    # Outputs should remain zero (no enable)
+    assert dut.OutputA.value == 0, "OutputA should be 0 after reset"
 
-    await run_with_timeout(test_logic(), timeout_sec=10, test_name="test_arm_and_trigger")
+    dut._log.info("✓ Reset test PASSED")
 
 
-@cocotb.test()
+@cocotb.test(timeout_time=10, timeout_unit="sec")
+async def test_arm_and_trigger(dut):
+    """Test 2: Arm FSM and trigger probe"""
+    dut._log.info("--- Test 2: Arm and Trigger Sequence ---")
+
+    # Setup
+    await setup_test(dut)
+
+    # Configure registers
+    await mcc_set_regs(dut, {
+        0: mcc_cr0(),           # Enable with all 3 control bits
+        20: 1,                  # Armed
+        23: 0x00,              # No clock division
+        24: 0xFF,              # Delay lower
+        25: 10,                # Firing duration
+        26: 8,                 # Cooling duration
+        27: 0x3D,              # Trigger threshold high (2.4V)
+        28: 0xCF,              # Trigger threshold low
+        29: 0x30,              # Intensity high
+        30: 0x00               # Intensity low
+    }, set_mcc_ready=True)
+
+    # Allow FSM to process arm command
+    await ClockCycles(dut.Clk, 5)
+
+    # Apply trigger signal above threshold
+    dut.InputA.value = PACKED_TRIGGER_HIGH  # > 2.4V on both lanes
+    await wait_for_change(dut.OutputA, 10)  # Probe trigger output fires
+
+    # Check that output becomes active (trigger output should be non-zero)
+    # Note: Can't access internal FSM state in MCC wrapper easily
+    dut._log.info("✓ Arm and trigger test PASSED")
+
+
+@cocotb.test(timeout_time=10, timeout_unit="sec")
 async def test_intensity_clamping(dut):
     """Test 3: Verify 3.0V intensity clamping"""
-    dut._log.info("=" * 70)
-    dut._log.info("Test 3: Intensity Clamping")
-    dut._log.info("=" * 70)
-
-    async def test_logic():
-        # Setup
-        await setup_clock(dut, clk_signal="Clk")
-        await reset_active_high(dut, rst_signal="Reset")
-        await init_mcc_inputs(dut)
+    dut._log.info("--- Test 3: Intensity Clamping ---")
 
-        # Set intensity above 3.0V limit
-        await mcc_set_regs(dut, {
-            0: mcc_cr0(),
-            20: 0,                 # Not armed
-            21: 1,                 # Force fire
-            29: 0x70,              # Intensity high (above 3.0V)
-            30: 0x00               # Intensity low
-        }, set_mcc_ready=True)
+    # Setup
+    await setup_test(dut)
 
-        # Pulse force_fire
-        await ClockCycles(dut.Clk, 2)
-        await mcc_set_regs(dut, {21: 0}, set_mcc_ready=True)
-        await ClockCycles(dut.Clk, 10)
+    # Set intensity above 3.0V limit
+    await mcc_set_regs(dut, {
+        0: mcc_cr0(),
+        20: 0,                 # Not armed
+        21: 1,                 # Force fire
+        29: 0x70,              # Intensity high (above 3.0V)
+        30: 0x00               # Intensity low
+    }, set_mcc_ready=True)
 
-        # The output should be clamped internally
-        # We can't directly check internal signals but test passes if no errors
-        dut._log.info("✓ Intensity clamping test PASSED")
+    # Pulse force_fire
+    await ClockCycles(dut.Clk, 2)
+    await mcc_set_regs(dut, {21: 0}, set_mcc_ready=True)
+    await wait_for_change(dut.OutputA, 10)
 
-    await run_with_timeout(test_logic(), timeout_sec=10, test_name="test_intensity_clamping")
+    # The output should be clamped internally
+    # We can't directly check internal signals but test passes if no errors
+    dut._log.info("✓ Intensity clamping test PASSED")
 
 
-@cocotb.test()
+@cocotb.test(timeout_time=10, timeout_unit="sec")
 async def test_timeout_behavior(dut):
     """Test 4: Verify armed timeout"""
-    dut._log.info("=" * 70)
-    dut._log.info("Test 4: Armed Timeout")
-    dut._log.info("=" * 70)
+    dut._log.info("--- Test 4: Armed Timeout ---")
 
-    async def test_logic():
-        # Setup
-        await setup_clock(dut, clk_signal="Clk")
-        await reset_active_high(dut, rst_signal="Reset")
-        await init_mcc_inputs(dut)
+    # Setup
+    await setup_test(dut)
 
-        # Configure with short timeout
-        await mcc_set_regs(dut, {
-            0: mcc_cr0(),
-            20: 1,                 # Armed
-            23: 0x00,              # No divider, timeout upper nibble
-            24: 0x10,              # 16 cycles total timeout
-            27: 0x3D,              # Trigger threshold high
-            28: 0xCF               # Trigger threshold low
-        }, set_mcc_ready=True)
+    # Configure with short timeout
+    await mcc_set_regs(dut, {
+        0: mcc_cr0(),
+        20: 1,                 # Armed
+        23: 0x00,              # No divider, timeout upper nibble
+        24: 0x10,              # 16 cycles total timeout
+        27: 0x3D,              # Trigger threshold high
+        28: 0xCF               # Trigger threshold low
+    }, set_mcc_ready=True)
 
-        # Keep trigger below threshold
-        dut.InputA.value = 0x1000  # Below 2.4V
+    # Keep trigger below threshold
+    dut.InputA.value = 0x1000  # Below 2.4V
 
-        # Wait for timeout (with margin)
-        await ClockCycles(dut.Clk, 30)
+    # Wait for timeout (with margin): debug output (OutputB) steps on ARMED → TIMEDOUT
+    await wait_for_change(dut.OutputB, 30)
 
-        dut._log.info("✓ Timeout test PASSED")
+    dut._log.info("✓ Timeout test PASSED")
 
-    await run_with_timeout(test_logic(), timeout_sec=10, test_name="test_timeout_behavior")
 
-
-@cocotb.test()
+@cocotb.test(timeout_time=15, timeout_unit="sec")
 async def test_full_cycle(dut):
     """Test 5: Complete operational cycle"""
-    dut._log.info("=" * 70)
-    dut._log.info("Test 5: Full Operational Cycle")
-    dut._log.info("=" * 70)
+    dut._log.info("--- Test 5: Full Operational Cycle ---")
+
+    # Setup
+    await setup_test(dut)
+
+    # Configure all parameters
+    await mcc_set_regs(dut, {
+        0: mcc_cr0(),
+        20: 0,                 # Not armed initially
+        22: 0,                 # Not reset
+        23: 0x00,              # No clock division
+        24: 0xFF,              # Long timeout
+        25: 16,                # Firing duration
+        26: 12,                # Cooling duration
+        27: 0x20,              # Trigger threshold high
+        28: 0x00,              # Trigger threshold low
+        29: 0x40,              # Intensity high
+        30: 0x00               # Intensity low
+    }, set_mcc_ready=True)
+
+    await ClockCycles(dut.Clk, 2)
+
+    # Arm (pulse CR20)
+    dut._log.debug("Arming FSM...")
+    await mcc_set_regs_seq(dut, [({20: 1}, 4), ({20: 0}, 4)])
+
+    # Trigger
+    dut._log.debug("Applying trigger...")
+    dut.InputA.value = PACKED_TRIGGER_OVER  # Above threshold
+    await ClockCycles(dut.Clk, 5)
+
+    # Wait for firing to end (CR25 = 16 cycles, plus margin)
+    dut._log.debug("Waiting for firing...")
+    await ClockCycles(dut.Clk, 24)
+
+    # Wait for cooling to end (CR26 = 12 cycles, plus margin)
+    dut._log.debug("Waiting for cooling...")
+    await ClockCycles(dut.Clk, 20)
+
+    # Reset FSM (pulse CR22)
+    dut._log.debug("Resetting FSM...")
+    await mcc_set_regs_seq(dut, [({22: 1}, 4), ({22: 0}, 4)])
+
+    dut._log.info("✓ Full cycle test PASSED")
 
-    async def test_logic():
-        # Setup
-        await setup_clock(dut, clk_signal="Clk")
-        await reset_active_high(dut, rst_signal="Reset")
-        await init_mcc_inputs(dut)
 
-        # Configure all parameters
-        await mcc_set_regs(dut, {
-            0: mcc_cr0(),
-            20: 0,                 # Not armed initially
-            22: 0,                 # Not reset
-            23: 0x00,              # No clock division
-            24: 0xFF,              # Long timeout
-            25: 16,                # Firing duration
-            26: 12,                # Cooling duration
-            27: 0x20,              # Trigger threshold high
-            28: 0x00,              # Trigger threshold low
-            29: 0x40,              # Intensity high
-            30: 0x00               # Intensity low
-        }, set_mcc_ready=True)
-
-        await ClockCycles(dut.Clk, 2)
-
-        # Arm
-        dut._log.info("Arming FSM...")
-        await mcc_set_regs(dut, {20: 1}, set_mcc_ready=True)
-        await ClockCycles(dut.Clk, 2)
-        await mcc_set_regs(dut, {20: 0}, set_mcc_ready=True)
-        await ClockCycles(dut.Clk, 2)
-
-        # Trigger
-        dut._log.info("Applying trigger...")
-        dut.InputA.value = 0x30003000  # Above threshold
-        await ClockCycles(dut.Clk, 5)
-
-        # Wait for firing
-        dut._log.info("Waiting for firing...")
-        await ClockCycles(dut.Clk, 20)
-
-        # Wait for cooling
-        dut._log.info("Waiting for cooling...")
-        await ClockCycles(dut.Clk, 15)
-
-        # Reset FSM
-        dut._log.info("Resetting FSM...")
-        await mcc_set_regs(dut, {22: 1}, set_mcc_ready=True)
-        await ClockCycles(dut.Clk, 2)
-        await mcc_set_regs(dut, {22: 0}, set_mcc_ready=True)
-        await ClockCycles(dut.Clk, 2)
-
-        dut._log.info("✓ Full cycle test PASSED")
-
-    await run_with_timeout(test_logic(), timeout_sec=15, test_name="test_full_cycle")
-
-
-@cocotb.test()
+@cocotb.test(timeout_time=15, timeout_unit="sec")
 async def test_clock_divider_integration(dut):
     """Test 6: Verify clock divider affects FSM timing"""
-    dut._log.info("=" * 70)
-    dut._log.info("Test 6: Clock Divider Integration")
-    dut._log.info("=" * 70)
+    dut._log.info("--- Test 6: Clock Divider Integration ---")
 
-    async def test_logic():
-        # Setup
-        await setup_clock(dut, clk_signal="Clk")
-        await reset_active_high(dut, rst_signal="Reset")
-        await init_mcc_inputs(dut)
+    # Setup
+    await setup_test(dut)
 
-        # Test 1: No clock division
-        dut._log.info("Testing without clock division...")
-        await mcc_set_regs(dut, {
-            0: mcc_cr0(),
-            21: 0,                 # Clear force fire
-            22: 0,                 # Clear reset
-            23: 0x00,              # No division
-            25: 4,                 # Short firing duration
-            26: 4                  # Short cooling
-        }, set_mcc_ready=True)
-
-        # Force fire and count duration
-        await mcc_set_regs(dut, {21: 1}, set_mcc_ready=True)
-        await ClockCycles(dut.Clk, 1)
-        await mcc_set_regs(dut, {21: 0}, set_mcc_ready=True)
-
-        # Wait for completion
-        await ClockCycles(dut.Clk, 20)
-        dut._log.info("Completed without divider")
-
-        # Reset FSM
-        await mcc_set_regs(dut, {22: 1}, set_mcc_ready=True)
-        await ClockCycles(dut.Clk, 2)
-        await mcc_set_regs(dut, {22: 0}, set_mcc_ready=True)
-        await ClockCycles(dut.Clk, 2)
-
-        # Test 2: With clock division
-        dut._log.info("Testing with clock division (÷4)...")
-        await mcc_set_regs(dut, {
-            23: 0x30,              # Divide by 4 (0x3 in upper nibble)
-        }, set_mcc_ready=True)
-
-        # Force fire with division
-        await mcc_set_regs(dut, {21: 1}, set_mcc_ready=True)
-        await ClockCycles(dut.Clk, 1)
-        await mcc_set_regs(dut, {21: 0}, set_mcc_ready=True)
-
-        # Should take longer with division
-        await ClockCycles(dut.Clk, 80)
-        dut._log.info("Completed with ÷4 divider")
-
-        dut._log.info("✓ Clock divider test PASSED")
-
-    await run_with_timeout(test_logic(), timeout_sec=15, test_name="test_clock_divider_integration")
-
-
-@cocotb.test()
-async def test_volo_ready_scheme(dut):
-    """Test 7: VOLO_READY 3-bit control scheme"""
-    dut._log.info("=" * 70)
-    dut._log.info("Test 7: VOLO_READY Control Scheme")
-    dut._log.info("=" * 70)
+    # Test 1: No clock division
+    dut._log.debug("Testing without clock division...")
+    await mcc_set_regs(dut, {
+        0: mcc_cr0(),
+        21: 0,                 # Clear force fire
+        22: 0,                 # Clear reset
+        23: 0x00,              # No division
+        25: 4,                 # Short firing duration
+        26: 4                  # Short cooling
+    }, set_mcc_ready=True)
 
-    async def test_logic():
-        # Setup
-        await setup_clock(dut, clk_signal="Clk")
-        await reset_active_high(dut, rst_signal="Reset")
-        await init_mcc_inputs(dut)
+    # Force fire and count duration
+    await mcc_set_regs_seq(dut, [({21: 1}, 1), ({21: 0}, 4)])
 
-        # Test: Module disabled when control bits are 0
-        await mcc_set_regs(dut, {0: 0x00000000}, set_mcc_ready=False)
-        await ClockCycles(dut.Clk, 5)
-        assert dut.OutputA.value == 0, "Module should be disabled (CR0=0)"
+    # Wait for completion
+    await ClockCycles(dut.Clk, 20)
+    dut._log.debug("Completed without divider")
 
-        # Test: Module enabled with all 3 bits
-        await mcc_set_regs(dut, {
-            0: mcc_cr0(),          # 0xE0000000
-            21: 1,                 # Force fire
-            29: 0x40,              # Intensity
-            30: 0x00
-        }, set_mcc_ready=True)
+    # Reset FSM
+    await mcc_set_regs_seq(dut, [({22: 1}, 4), ({22: 0}, 4)])
 
-        await ClockCycles(dut.Clk, 10)
-        # Module should respond to force_fire
-        dut._log.info("✓ VOLO_READY scheme test PASSED")
+    # Test 2: With clock division
+    dut._log.debug("Testing with clock division (÷4)...")
+    # Select ÷4, then force fire with division
+    await mcc_set_regs_seq(dut, [
+        ({23: 0x30}, 4),       # Divide by 4 (0x3 in upper nibble)
+        ({21: 1}, 1),
+        ({21: 0}, 4),
+    ])
 
-    await run_with_timeout(test_logic(), timeout_sec=10, test_name="test_volo_ready_scheme")
+    # Should take longer with division
+    await ClockCycles(dut.Clk, 80)
+    dut._log.debug("Completed with ÷4 divider")
+
+    dut._log.info("✓ Clock divider test PASSED")
+
+
+@cocotb.test(timeout_time=10, timeout_unit="sec")
+async def test_volo_ready_scheme(dut):
+    """Test 7: VOLO_READY 3-bit control scheme"""
+    dut._log.info("--- Test 7: VOLO_READY Control Scheme ---")
+
+    # Setup
+    await setup_test(dut)
+
+    # Test: Module disabled when control bits are 0
+    await mcc_set_regs(dut, {0: 0x00000000}, set_mcc_ready=False)
+    await ClockCycles(dut.Clk, 5)
+    assert dut.OutputA.value == 0, "Module should be disabled (CR0=0)"
+
+    # Test: Module enabled with all 3 bits
+    await mcc_set_regs(dut, {
+        0: mcc_cr0(),          # 0xE0000000
+        21: 1,                 # Force fire
+        29: 0x40,              # Intensity
+        30: 0x00
+    }, set_mcc_ready=True)
+
+    await ClockCycles(dut.Clk, 10)
+    # Module should respond to force_fire
+    dut._log.info("✓ VOLO_READY scheme test PASSED")
 
 
 # Test summary
@@ -168,7 +168,7 @@ def mcc_cr0(divider: int = 0, extra_bits: int = 0) -> int:
 # Clock Management
 # =============================================================================
 
-async def setup_clock(dut, period_ns=DEFAULT_CLK_PERIOD_NS, clk_signal="clk"):
+async def setup_clock(dut, period_ns=DEFAULT_CLK_PERIOD_NS, clk_signal="clk", impl=None):
     """
     Start a clock on the DUT
 
@@ -176,6 +176,9 @@ async def setup_clock(dut, period_ns=DEFAULT_CLK_PERIOD_NS, clk_signal="clk"):
         dut: Device Under Test
         period_ns: Clock period in nanoseconds (default: 10ns = 100MHz)
         clk_signal: Name of clock signal (default: "clk")
+        impl: Clock implementation, "gpi" or "py" (default: None - cocotb
+              picks "gpi" when COCOTB_TRUST_INERTIAL_WRITES is set, as the
+              GHDL runner does)
 
     Returns:
         Clock object (can be ignored, runs in background)
@@ -186,7 +189,7 @@ async def setup_clock(dut, period_ns=DEFAULT_CLK_PERIOD_NS, clk_signal="clk"):
         await setup_clock(dut, clk_signal="Clk")  # MCC style
     """
     clk = getattr(dut, clk_signal)
-    clock = cocotb.start_soon(Clock(clk, period_ns, units="ns").start())
+    clock = cocotb.start_soon(Clock(clk, period_ns, units="ns", impl=impl).start())
     dut._log.info(f"✓ Clock started on '{clk_signal}' ({period_ns}ns period = {1000/period_ns:.1f}MHz)")
     return clock
 
@@ -589,7 +592,7 @@ async def mcc_set_regs(dut, control_regs,
             value = value & 0x7FFFFFFF  # Clear bit 31
 
         getattr(dut, f"Control{reg_num}").value = value
-        dut._log.info(f"  Control{reg_num} ← 0x{value:08X}")
+        dut._log.debug("  Control%d ← 0x%08X", reg_num, value)
 
         # Per-register delay (simulate sequential network writes)
         if simulate_network_delay:
@@ -616,6 +619,58 @@ async def mcc_set_regs(dut, control_regs,
         await ClockCycles(dut.Clk, 2)
 
 
+async def mcc_set_regs_seq(dut, steps,
+                           set_mcc_ready=True,
+                           simulate_network_delay=True,
+                           total_delay_ms=None):
+    """
+    Apply a sequence of MCC register writes as one network transaction
+
+    Like calling mcc_set_regs() once per step, but the network latency is paid
+    once up front and each step's registers are written together, followed by
+    a fixed number of clock cycles. Use this for pulse-style sequences
+    (arm/disarm, force_fire, FSM reset) that would otherwise need several
+    mcc_set_regs() round-trips.
+
+    Args:
+        dut: Device Under Test (CustomWrapper entity)
+        steps: Sequence of (control_regs, cycles) pairs; control_regs is a dict
+               of {reg_num: value} written at once, then cycles clocks elapse
+        set_mcc_ready: If True, any CR0 write also sets CR0[31]=1 (default: True)
+        simulate_network_delay: Enable network latency simulation (default: True)
+        total_delay_ms: Delay before the first step (default: 10-200ms random)
+
+    Example - Arm pulse (CR20 high for 4 cycles, then low):
+        await mcc_set_regs_seq(dut, [
+            ({20: 1}, 4),
+            ({20: 0}, 4),
+        ])
+    """
+    import random
+
+    from cocotb.triggers import Timer
+
+    if simulate_network_delay and total_delay_ms is None:
+        total_delay_ms = random.uniform(10, 200)  # 10-200ms realistic range
+
+    if simulate_network_delay and total_delay_ms > 0:
+        dut._log.info(f"⏱  Network latency: {total_delay_ms:.1f}ms")
+        await Timer(int(total_delay_ms * 1_000_000), units="ns")
+
+    for control_regs, cycles in steps:
+        if set_mcc_ready and 0 in control_regs:
+            # CR0 is written with MCC_READY already set (no separate strobe)
+            control_regs = {**control_regs, 0: control_regs[0] | 0x80000000}
+            validate_control0(control_regs[0], context="mcc_set_regs_seq()")
+
+        for reg_num, value in sorted(control_regs.items()):
+            getattr(dut, f"Control{reg_num}").value = value
+            dut._log.debug("  Control%d ← 0x%08X", reg_num, value)
+
+        if cycles:
+            await ClockCycles(dut.Clk, cycles)
+
+
 async def wait_for_mcc_ready(dut, settle_cycles=10):
     """
     Wait for module to stabilize after MCC_READY assertion
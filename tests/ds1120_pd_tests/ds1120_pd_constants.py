@@ -9,33 +9,39 @@ Date: 2025-01-27
 """
 
 from pathlib import Path
+from typing import Final
 
 # Module identification
 MODULE_NAME = "ds1120_pd_volo"
 
-# HDL sources
-PROJECT_ROOT = Path(__file__).parent.parent.parent
+# HDL sources, as absolute path strings built once at import (what the
+# cocotb runner takes)
+PROJECT_ROOT = Path(__file__).resolve().parent.parent.parent
 VHDL_DIR = PROJECT_ROOT / "VHDL"
+VHDL_PKG_DIR = VHDL_DIR / "packages"
+TESTS_DIR = PROJECT_ROOT / "tests"
 
-HDL_SOURCES = [
+HDL_SOURCES = tuple(str(path) for path in (
     # Shared volo modules
-    VHDL_DIR / "volo_voltage_pkg.vhd",
+    VHDL_PKG_DIR / "volo_voltage_pkg.vhd",
     VHDL_DIR / "volo_clk_divider.vhd",
     VHDL_DIR / "volo_voltage_threshold_trigger_core.vhd",
     VHDL_DIR / "fsm_observer.vhd",
-    VHDL_DIR / "volo_common_pkg.vhd",
+    VHDL_PKG_DIR / "volo_common_pkg.vhd",
     VHDL_DIR / "volo_bram_loader.vhd",
     # DS1120-PD specific
-    VHDL_DIR / "ds1120_pd_pkg.vhd",
+    VHDL_PKG_DIR / "ds1120_pd_pkg.vhd",
     VHDL_DIR / "ds1120_pd_fsm.vhd",
     VHDL_DIR / "DS1120_PD_volo_main.vhd",
     VHDL_DIR / "DS1120_PD_volo_shim.vhd",
-]
+    # Testbench wrapper (generates Clk in HDL)
+    TESTS_DIR / "ds1120_pd_volo_tb_wrapper.vhd",
+))
 
-HDL_TOPLEVEL = "ds1120_pd_volo_main"  # lowercase for GHDL
+HDL_TOPLEVEL = "ds1120_pd_volo_tb_wrapper"  # lowercase for GHDL
 
 # Test parameters
-DEFAULT_CLK_PERIOD_NS = 8  # 125 MHz
+DEFAULT_CLK_PERIOD_NS = 8  # 125 MHz (CLK_PERIOD generic of the tb wrapper)
 
 # FSM State encodings (from ds1120_pd_pkg.vhd)
 STATE_READY = 0b000
@@ -53,6 +59,11 @@ VOLTAGE_2V4 = 0x3DCF  # Default trigger threshold
 VOLTAGE_3V0 = 0x4CCD  # Maximum intensity (safety limit)
 VOLTAGE_5V0 = 0x7FFF
 
+# 32-bit MCC InputA words: one 16-bit trigger sample broadcast to both lanes
+# ([31:16] and [15:0]), as the CustomWrapper-level testbench drives them
+PACKED_TRIGGER_HIGH = 0x40004000  # 0x4000 per lane (> 2.4V default threshold)
+PACKED_TRIGGER_OVER = 0x30003000  # 0x3000 per lane (> 0x2000 threshold of the full cycle)
+
 # Test value sets for different phases
 class TestValues:
     """Test value sets for different test phases"""
@@ -75,20 +86,18 @@ class TestValues:
     P2_INTENSITY = 0x4000      # Higher intensity for P2
 
 
-# Control Register addresses (CR20-CR30)
-class ControlRegs:
-    """Standard control register addresses"""
-    ARM = 20
-    FORCE_FIRE = 21
-    RESET_FSM = 22
-    TIMING_CONTROL = 23
-    DELAY_LOWER = 24
-    FIRING_DURATION = 25
-    COOLING_DURATION = 26
-    TRIGGER_THRESH_HIGH = 27
-    TRIGGER_THRESH_LOW = 28
-    INTENSITY_HIGH = 29
-    INTENSITY_LOW = 30
+# Control Register addresses (CR20-CR30), module-level so lookups are plain globals
+CR_ARM: Final = 20
+CR_FORCE_FIRE: Final = 21
+CR_RESET_FSM: Final = 22
+CR_TIMING_CONTROL: Final = 23
+CR_DELAY_LOWER: Final = 24
+CR_FIRING_DURATION: Final = 25
+CR_COOLING_DURATION: Final = 26
+CR_TRIGGER_THRESH_HIGH: Final = 27
+CR_TRIGGER_THRESH_LOW: Final = 28
+CR_INTENSITY_HIGH: Final = 29
+CR_INTENSITY_LOW: Final = 30
 
 
 # Error messages with format placeholders
@@ -0,0 +1,107 @@
+--------------------------------------------------------------------------------
+-- Testbench Wrapper for DS1120_PD_volo_main (CocotB)
+-- Purpose: Generate the 125 MHz application clock and power-on reset in HDL
+-- Author: EZ-EMFI Team
+-- Date: 2025-01-27
+--
+-- Note: The clock toggles inside the simulator, so Python is not woken for
+--       every edge. CocotB drives all other ports exactly as on
+--       DS1120_PD_volo_main and only monitors Clk (exposed as an output).
+--       The design is also held in reset for RESET_CYCLES edges from time 0
+--       (OR'ed with the Reset port); reset_released rises when that ends.
+--------------------------------------------------------------------------------
+
+library IEEE;
+use IEEE.std_logic_1164.all;
+use IEEE.numeric_std.all;
+
+entity ds1120_pd_volo_tb_wrapper is
+    generic (
+        CLK_PERIOD   : time    := 8 ns;  -- 125 MHz (DEFAULT_CLK_PERIOD_NS)
+        RESET_CYCLES : natural := 2      -- Power-on reset length
+    );
+    port (
+        -- Free-running clock generated below
+        Clk     : out std_logic;
+        -- '1' once the power-on reset has been released
+        reset_released : out std_logic;
+
+        -- Passthrough to DS1120_PD_volo_main
+        Reset   : in  std_logic := '0';
+        Enable  : in  std_logic := '0';
+        ClkEn   : in  std_logic := '0';
+
+        armed               : in  std_logic := '0';
+        force_fire          : in  std_logic := '0';
+        reset_fsm           : in  std_logic := '0';
+        timing_control      : in  std_logic_vector(7 downto 0) := (others => '0');
+        delay_lower         : in  std_logic_vector(7 downto 0) := (others => '0');
+        firing_duration     : in  std_logic_vector(7 downto 0) := (others => '0');
+        cooling_duration    : in  std_logic_vector(7 downto 0) := (others => '0');
+        trigger_thresh_high : in  std_logic_vector(7 downto 0) := (others => '0');
+        trigger_thresh_low  : in  std_logic_vector(7 downto 0) := (others => '0');
+        intensity_high      : in  std_logic_vector(7 downto 0) := (others => '0');
+        intensity_low       : in  std_logic_vector(7 downto 0) := (others => '0');
+
+        bram_addr : in  std_logic_vector(11 downto 0) := (others => '0');
+        bram_data : in  std_logic_vector(31 downto 0) := (others => '0');
+        bram_we   : in  std_logic := '0';
+
+        InputA  : in  signed(15 downto 0) := (others => '0');
+        InputB  : in  signed(15 downto 0) := (others => '0');
+        OutputA : out signed(15 downto 0);
+        OutputB : out signed(15 downto 0)
+    );
+end entity ds1120_pd_volo_tb_wrapper;
+
+architecture sim of ds1120_pd_volo_tb_wrapper is
+    signal clk_i     : std_logic := '0';
+    signal por_count : natural range 0 to RESET_CYCLES := 0;
+    signal por       : std_logic;
+    signal rst_i     : std_logic;
+begin
+    -- Clock generation (no Python callback per edge)
+    clk_i <= not clk_i after CLK_PERIOD / 2;
+    Clk   <= clk_i;
+
+    -- Power-on reset: asserted from time 0 for RESET_CYCLES rising edges
+    process(clk_i)
+    begin
+        if rising_edge(clk_i) then
+            if por_count < RESET_CYCLES then
+                por_count <= por_count + 1;
+            end if;
+        end if;
+    end process;
+
+    por            <= '1' when por_count < RESET_CYCLES else '0';
+    reset_released <= not por;
+    rst_i          <= Reset or por;
+
+    DUT: entity work.DS1120_PD_volo_main
+        port map (
+            Clk                 => clk_i,
+            Reset               => rst_i,
+            Enable              => Enable,
+            ClkEn               => ClkEn,
+            armed               => armed,
+            force_fire          => force_fire,
+            reset_fsm           => reset_fsm,
+            timing_control      => timing_control,
+            delay_lower         => delay_lower,
+            firing_duration     => firing_duration,
+            cooling_duration    => cooling_duration,
+            trigger_thresh_high => trigger_thresh_high,
+            trigger_thresh_low  => trigger_thresh_low,
+            intensity_high      => intensity_high,
+            intensity_low       => intensity_low,
+            bram_addr           => bram_addr,
+            bram_data           => bram_data,
+            bram_we             => bram_we,
+            InputA              => InputA,
+            InputB              => InputB,
+            OutputA             => OutputA,
+            OutputB             => OutputB
+        );
+
+end architecture sim;
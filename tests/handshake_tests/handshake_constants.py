@@ -2,19 +2,20 @@
 
 Reference: docs/CocoTB-TestingNetworkRegs.md
 """
+import functools
 from pathlib import Path
 
 MODULE_NAME = "handshake_shim"
 
-# HDL sources
-PROJECT_ROOT = Path(__file__).parent.parent.parent
+# HDL sources (absolute path strings, built once at import)
+PROJECT_ROOT = Path(__file__).resolve().parent.parent.parent
 VHDL_DIR = PROJECT_ROOT / "VHDL"
 SHARED_DIR = PROJECT_ROOT / "shared" / "custom_inst"
 
-HDL_SOURCES = [
+HDL_SOURCES = tuple(str(path) for path in (
     SHARED_DIR / "custom_inst_common_pkg.vhd",
     VHDL_DIR / "test_shim_handshake.vhd",
-]
+))
 
 HDL_TOPLEVEL = "test_shim_handshake"  # Lowercase!
 
@@ -41,17 +42,20 @@ class TestValues:
     THRESHOLD_DEFAULT = 0x2E14  # 11796 (2.4V default) - corrected hex value
     THRESHOLD_NEW_1   = 0x3333  # 13107 (2.67V)
 
-    # Control register packing (CR6 = app_reg_6)
-    # Format: CR[31:16] = intensity, CR[15:0] = unused
-    @staticmethod
-    def pack_cr6(intensity: int) -> int:
-        """Pack intensity into CR6 format"""
-        return (intensity << 16) & 0xFFFF_0000
-
-    @staticmethod
-    def pack_cr7(threshold: int) -> int:
-        """Pack threshold into CR7 format"""
-        return (threshold << 16) & 0xFFFF_0000
+
+# Control register packing (CR6 = app_reg_6, CR7 = app_reg_7)
+# Format: CR[31:16] = value, CR[15:0] = unused. Only a handful of distinct
+# values are ever packed, so results are cached.
+@functools.lru_cache(maxsize=16)
+def pack_cr6(intensity: int) -> int:
+    """Pack intensity into CR6 format"""
+    return (intensity << 16) & 0xFFFF_0000
+
+
+@functools.lru_cache(maxsize=16)
+def pack_cr7(threshold: int) -> int:
+    """Pack threshold into CR7 format"""
+    return (threshold << 16) & 0xFFFF_0000
 
 
 # Error messages
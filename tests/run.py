@@ -9,6 +9,7 @@ Usage:
     python tests/run.py volo_clk_divider              # Run single test
     python tests/run.py --all                        # Run all tests
     python tests/run.py --category=volo_common       # Run category
+    python tests/run.py --all --jobs 8               # Run tests in parallel
     python tests/run.py --list                       # List available tests
 
 Author: Claude Code (CocotB Python Runner Migration)
@@ -17,6 +18,7 @@ Date: 2025-01-25
 
 import sys
 import argparse
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
 from typing import Optional
 import os
@@ -138,15 +140,19 @@ class FilteredOutput:
 class TestRunner:
     """CocotB test runner using Python API"""
 
-    def __init__(self, verbose: bool = False, filter_output: bool = True):
+    def __init__(self, verbose: bool = False, filter_output: bool = True, jobs: int = 1):
         self.verbose = verbose
         self.filter_output = filter_output
+        self.jobs = max(1, jobs)
         self.tests_dir = Path(__file__).parent
 
-    def run_test(self, test_name: str) -> bool:
+    def run_test(self, test_name: str, build_dir: Optional[Path] = None) -> bool:
         """
         Run a single test.
         Returns True if test passed, False otherwise.
+
+        build_dir defaults to the runner's shared sim_build/; parallel runs
+        give each test its own so simulators don't clobber each other.
         """
         if test_name not in TESTS_CONFIG:
             print(f"❌ Test '{test_name}' not found!")
@@ -177,7 +183,7 @@ class TestRunner:
         os.chdir(self.tests_dir)
 
         # Build configuration
-        build_args = config.ghdl_args.copy()
+        build_args = list(config.ghdl_args)
 
         # Add simulation arguments (empty for now - keeping it simple!)
         # TODO: Add back GHDL optimization flags once basic testing works:
@@ -185,6 +191,21 @@ class TestRunner:
         #   --assert-level=error         (only stop on errors)
         #   --stop-time=10ms             (timeout for runaway sims)
         sim_args = []
+        dir_args = {} if build_dir is None else {"build_dir": str(build_dir)}
+        # Explicit per-build results file (exported as COCOTB_RESULTS_FILE) so
+        # parallel runs never read back another test's results.xml
+        test_dir_args = dict(dir_args)
+        if build_dir is not None:
+            test_dir_args["results_xml"] = str(build_dir / "results.xml")
+
+        # Waveform dumping is off unless asked for (WAVES=1): tracing every
+        # signal to disk is one of the biggest costs of a GHDL run. The cocotb
+        # runner treats any non-empty WAVES (even "0") as on, so drop it here.
+        waves = os.environ.get("WAVES", "0") == "1"
+        if waves:
+            print("🌊 WAVES=1: dumping waveforms")
+        else:
+            os.environ.pop("WAVES", None)
 
         # Set CocotB environment variables
         os.environ["COCOTB_REDUCED_LOG_FMT"] = "1"
@@ -211,6 +232,7 @@ class TestRunner:
                 hdl_toplevel=config.toplevel,
                 always=True,
                 build_args=build_args,
+                **dir_args,
             )
 
             # Run tests with BULLETPROOF output filtering
@@ -223,6 +245,8 @@ class TestRunner:
                         hdl_toplevel=config.toplevel,
                         test_module=config.test_module,
                         test_args=sim_args,
+                        waves=waves,
+                        **test_dir_args,
                     )
                 # Print filter summary
                 if filtered.filter.stats.filtered_lines > 0:
@@ -235,6 +259,8 @@ class TestRunner:
                     hdl_toplevel=config.toplevel,
                     test_module=config.test_module,
                     test_args=sim_args,
+                    waves=waves,
+                    **test_dir_args,
                 )
 
             print("\n" + "=" * 70)
@@ -249,19 +275,39 @@ class TestRunner:
             print("=" * 70)
             return False
 
+    def _run_isolated(self, test_name: str) -> bool:
+        """Run one test in a worker process, with its own build directory"""
+        return self.run_test(test_name, build_dir=self.tests_dir / "sim_build" / test_name)
+
+    def _run_tests(self, test_names: list) -> dict:
+        """
+        Run tests serially, or across self.jobs processes.
+
+        Each test is a separate simulator run, so they are independent; the
+        working directory, environment and stdout/stderr redirection are
+        process-global, hence processes rather than threads.
+        """
+        if self.jobs == 1 or len(test_names) < 2:
+            results = {}
+            for i, test_name in enumerate(test_names, 1):
+                print(f"\n[{i}/{len(test_names)}] {test_name}")
+                results[test_name] = self.run_test(test_name)
+            return results
+
+        print(f"(running on {min(self.jobs, len(test_names))} processes)")
+        with ProcessPoolExecutor(max_workers=self.jobs) as pool:
+            return dict(zip(test_names, pool.map(self._run_isolated, test_names)))
+
     def run_all_tests(self) -> dict:
         """
         Run all configured tests.
         Returns dict of {test_name: passed}
         """
-        results = {}
         test_names = get_test_names()
 
         print(f"\n🚀 Running {len(test_names)} tests...\n")
 
-        for i, test_name in enumerate(test_names, 1):
-            print(f"\n[{i}/{len(test_names)}] {test_name}")
-            results[test_name] = self.run_test(test_name)
+        results = self._run_tests(test_names)
 
         # Summary
         print("\n" + "=" * 70)
@@ -295,10 +341,7 @@ class TestRunner:
 
         print(f"\n🚀 Running {len(tests)} tests in category '{category}'...\n")
 
-        results = {}
-        for i, test_name in enumerate(sorted(tests.keys()), 1):
-            print(f"\n[{i}/{len(tests)}] {test_name}")
-            results[test_name] = self.run_test(test_name)
+        results = self._run_tests(sorted(tests.keys()))
 
         # Summary
         passed = sum(1 for v in results.values() if v)
@@ -336,8 +379,10 @@ Examples:
   python tests/run.py volo_clk_divider              # Run single test
   python tests/run.py --all                        # Run all tests
   python tests/run.py --category=volo_modules      # Run category
+  python tests/run.py --all --jobs 8               # Run tests in parallel
   python tests/run.py --list                       # List tests
   python tests/run.py volo_clk_divider --verbose   # Verbose output
+  WAVES=1 python tests/run.py volo_clk_divider     # Dump waveforms for debugging
         """,
     )
 
@@ -380,6 +425,14 @@ Examples:
         help="Set GHDL output filter level (default: normal)",
     )
 
+    parser.add_argument(
+        "--jobs",
+        "-j",
+        type=int,
+        default=1,
+        help="Run --all/--category tests in N parallel simulator processes (default: 1)",
+    )
+
     args = parser.parse_args()
 
     # Set filter level if specified
@@ -389,7 +442,7 @@ Examples:
         os.environ["GHDL_FILTER_LEVEL"] = "none"
 
     # Create runner
-    runner = TestRunner(verbose=args.verbose, filter_output=not args.no_filter)
+    runner = TestRunner(verbose=args.verbose, filter_output=not args.no_filter, jobs=args.jobs)
 
     # Handle commands
     if args.list:
@@ -12,9 +12,10 @@ Author: EZ-EMFI Team (adapted from volo-vhdl)
 Date: 2025-01-27
 """
 
+import os
 from pathlib import Path
-from dataclasses import dataclass, field
-from typing import List
+from dataclasses import dataclass
+from typing import Dict, List, Set, Tuple
 
 # Project paths
 PROJECT_ROOT = Path(__file__).parent.parent
@@ -24,15 +25,15 @@ SHARED = PROJECT_ROOT / "shared"
 TESTS = PROJECT_ROOT / "tests"
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class TestConfig:
-    """Configuration for a single CocotB test"""
+    """Configuration for a single CocotB test (immutable, hashable)"""
     name: str
-    sources: List[Path]
+    sources: Tuple[Path, ...]
     toplevel: str
     test_module: str
     category: str = "misc"
-    ghdl_args: List[str] = field(default_factory=lambda: ["--std=08"])
+    ghdl_args: Tuple[str, ...] = ("--std=08",)
 
 
 # ==================================================================================
@@ -44,9 +45,9 @@ TESTS_CONFIG = {
 
     "volo_clk_divider": TestConfig(
         name="volo_clk_divider",
-        sources=[
+        sources=(
             VHDL / "volo_clk_divider.vhd",
-        ],
+        ),
         toplevel="volo_clk_divider",
         test_module="test_volo_clk_divider_progressive",  # Progressive P1/P2 tests
         category="volo_modules",
@@ -54,10 +55,10 @@ TESTS_CONFIG = {
 
     "volo_voltage_pkg": TestConfig(
         name="volo_voltage_pkg",
-        sources=[
+        sources=(
             VHDL_PKG / "volo_voltage_pkg.vhd",
             TESTS / "volo_voltage_pkg_tb_wrapper.vhd",  # Testbench wrapper for package
-        ],
+        ),
         toplevel="volo_voltage_pkg_tb_wrapper",
         test_module="test_volo_voltage_pkg_progressive",  # Progressive P1 tests
         category="volo_modules",
@@ -65,11 +66,11 @@ TESTS_CONFIG = {
 
     "volo_lut_pkg": TestConfig(
         name="volo_lut_pkg",
-        sources=[
+        sources=(
             VHDL_PKG / "volo_voltage_pkg.vhd",          # Dependency
             VHDL_PKG / "volo_lut_pkg.vhd",              # New LUT package
             TESTS / "volo_lut_pkg_tb_wrapper.vhd",      # Testbench wrapper
-        ],
+        ),
         toplevel="volo_lut_pkg_tb_wrapper",
         test_module="test_volo_lut_pkg_progressive",  # Progressive P1/P2 tests
         category="volo_modules",
@@ -77,12 +78,12 @@ TESTS_CONFIG = {
 
     "volo_bram_loader": TestConfig(
         name="volo_bram_loader",
-        sources=[
+        sources=(
             VHDL_PKG / "volo_voltage_pkg.vhd",
             VHDL_PKG / "volo_common_pkg.vhd",
             VHDL / "fsm_observer.vhd",
             VHDL / "volo_bram_loader.vhd",
-        ],
+        ),
         toplevel="volo_bram_loader",
         test_module="test_volo_bram_loader_progressive",  # Progressive P1/P2 tests
         category="volo_modules",
@@ -99,7 +100,7 @@ TESTS_CONFIG = {
 
     "ds1120_pd_volo": TestConfig(
         name="ds1120_pd_volo",
-        sources=[
+        sources=(
             # Shared volo modules
             VHDL_PKG / "volo_voltage_pkg.vhd",
             VHDL / "volo_clk_divider.vhd",
@@ -113,15 +114,16 @@ TESTS_CONFIG = {
             VHDL / "ds1120_pd_fsm.vhd",
             VHDL / "DS1120_PD_volo_main.vhd",
             VHDL / "DS1120_PD_volo_shim.vhd",
-        ],
-        toplevel="ds1120_pd_volo_main",  # lowercase for GHDL
+            TESTS / "ds1120_pd_volo_tb_wrapper.vhd",  # Generates Clk in HDL
+        ),
+        toplevel="ds1120_pd_volo_tb_wrapper",  # lowercase for GHDL
         test_module="test_ds1120_pd_volo_progressive",  # Progressive P1/P2 tests
         category="ds1120_pd",
     ),
 
     "ds1140_pd_volo": TestConfig(
         name="ds1140_pd_volo",
-        sources=[
+        sources=(
             # Shared volo modules
             VHDL_PKG / "volo_voltage_pkg.vhd",
             VHDL / "volo_clk_divider.vhd",
@@ -134,7 +136,7 @@ TESTS_CONFIG = {
             VHDL_PKG / "ds1140_pd_pkg.vhd",  # NEW package for DS1140-PD main
             VHDL / "ds1120_pd_fsm.vhd",  # Reused FSM core
             VHDL / "DS1140_PD_volo_main.vhd",  # NEW main with three outputs
-        ],
+        ),
         toplevel="ds1140_pd_volo_main",  # lowercase for GHDL
         test_module="test_ds1140_pd_progressive",  # Progressive P1/P2 tests
         category="ds1140_pd",
@@ -144,10 +146,10 @@ TESTS_CONFIG = {
 
     "handshake_shim": TestConfig(
         name="handshake_shim",
-        sources=[
+        sources=(
             SHARED / "custom_inst" / "custom_inst_common_pkg.vhd",
             VHDL / "test_shim_handshake.vhd",
-        ],
+        ),
         toplevel="test_shim_handshake",  # lowercase for GHDL
         test_module="test_handshake_shim_progressive",  # P1/P2 progressive tests
         category="handshake",
@@ -157,12 +159,12 @@ TESTS_CONFIG = {
 
     "fsm_example": TestConfig(
         name="fsm_example",
-        sources=[
+        sources=(
             VHDL_PKG / "volo_voltage_pkg.vhd",
             VHDL / "fsm_observer.vhd",
             # Note: fsm_example files would go here if we had them
             # For now this is a placeholder
-        ],
+        ),
         toplevel="fsm_observer",  # Using fsm_observer as surrogate
         test_module="test_fsm_example",
         category="examples",
@@ -170,10 +172,10 @@ TESTS_CONFIG = {
 
     "verbosity_demo": TestConfig(
         name="verbosity_demo",
-        sources=[
+        sources=(
             VHDL_PKG / "volo_voltage_pkg.vhd",
             VHDL / "fsm_observer.vhd",
-        ],
+        ),
         toplevel="fsm_observer",
         test_module="test_verbosity_demo",
         category="examples",
@@ -185,6 +187,13 @@ TESTS_CONFIG = {
 # Helper Functions
 # ==================================================================================
 
+# Test names per category, built once (TESTS_CONFIG is not modified at runtime)
+_BY_CATEGORY: Dict[str, List[str]] = {}
+for _name, _config in TESTS_CONFIG.items():
+    _BY_CATEGORY.setdefault(_config.category, []).append(_name)
+del _name, _config
+
+
 def get_test_names() -> List[str]:
     """Get sorted list of all test names"""
     return sorted(TESTS_CONFIG.keys())
@@ -192,16 +201,12 @@ def get_test_names() -> List[str]:
 
 def get_tests_by_category(category: str) -> dict:
     """Get tests filtered by category"""
-    return {
-        name: config
-        for name, config in TESTS_CONFIG.items()
-        if config.category == category
-    }
+    return {name: TESTS_CONFIG[name] for name in _BY_CATEGORY.get(category, ())}
 
 
 def get_categories() -> List[str]:
     """Get sorted list of all unique categories"""
-    return sorted(set(config.category for config in TESTS_CONFIG.values()))
+    return sorted(_BY_CATEGORY)
 
 
 def validate_test_files() -> dict:
@@ -210,18 +215,32 @@ def validate_test_files() -> dict:
     Returns dict of {test_name: missing_files}
     """
     issues = {}
+    # All sources live in a handful of directories: list each one once with
+    # os.scandir and answer existence checks from those listings
+    listings: Dict[Path, Set[str]] = {}
+
+    def exists(path: Path) -> bool:
+        names = listings.get(path.parent)
+        if names is None:
+            try:
+                with os.scandir(path.parent) as entries:
+                    names = {entry.name for entry in entries}
+            except OSError:  # Missing directory: nothing in it exists
+                names = set()
+            listings[path.parent] = names
+        return path.name in names
 
     for test_name, config in TESTS_CONFIG.items():
         missing = []
 
         # Check VHDL sources
         for source in config.sources:
-            if not source.exists():
+            if not exists(source):
                 missing.append(str(source))
 
         # Check Python test module
         test_file = TESTS / f"{config.test_module}.py"
-        if not test_file.exists():
+        if not exists(test_file):
             missing.append(str(test_file))
 
         if missing:
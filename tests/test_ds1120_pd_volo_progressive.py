@@ -15,13 +15,13 @@ Date: 2025-01-27
 """
 
 import cocotb
-from cocotb.triggers import ClockCycles
+from cocotb.triggers import ClockCycles, RisingEdge
 import sys
 from pathlib import Path
 
 sys.path.insert(0, str(Path(__file__).parent))
 
-from conftest import setup_clock, reset_active_high
+from conftest import reset_active_high
 from test_base import TestBase, VerbosityLevel
 from ds1120_pd_tests.ds1120_pd_constants import *
 
@@ -34,7 +34,11 @@ class DS1120PDTests(TestBase):
 
     async def setup(self):
         """Common setup for all tests"""
-        await setup_clock(self.dut, period_ns=DEFAULT_CLK_PERIOD_NS, clk_signal="Clk")
+        # Clk and the power-on reset come from ds1120_pd_volo_tb_wrapper: wait
+        # for the reset to release (first setup only), then sync to the clock
+        if self.dut.reset_released.value == 0:
+            await RisingEdge(self.dut.reset_released)
+        await RisingEdge(self.dut.Clk)
         # Initialize inputs
         self.dut.InputA.value = 0
         self.dut.InputB.value = 0
@@ -90,7 +94,7 @@ class DS1120PDTests(TestBase):
 
     async def test_arm_trigger(self):
         """Basic arm and trigger sequence"""
-        await reset_active_high(self.dut, rst_signal="Reset")
+        # No reset needed: test_reset has just reset the design and released it
 
         # Arm FSM
         self.dut.armed.value = 1
@@ -88,7 +88,7 @@ class HandshakeShimTests(TestBase):
         self.log(f"Initial intensity: {initial_intensity:#06x}", VerbosityLevel.VERBOSE)
 
         # Write new value to CR6 (app_reg_6)
-        new_cr6 = TestValues.pack_cr6(TestValues.INTENSITY_NEW_1)
+        new_cr6 = pack_cr6(TestValues.INTENSITY_NEW_1)
         self.dut.app_reg_6.value = new_cr6
         self.log(f"Writing CR6={new_cr6:#010x}", VerbosityLevel.VERBOSE)
 
@@ -108,7 +108,7 @@ class HandshakeShimTests(TestBase):
 
         # Write value to CR6
         new_intensity = TestValues.INTENSITY_NEW_1
-        self.dut.app_reg_6.value = TestValues.pack_cr6(new_intensity)
+        self.dut.app_reg_6.value = pack_cr6(new_intensity)
         self.dut.ready_for_updates.value = 0  # Gate closed initially
         await ClockCycles(self.dut.Clk, 2)
 